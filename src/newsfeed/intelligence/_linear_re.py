@@ -0,0 +1,39 @@
+"""Linear-time regex compilation for patterns run over untrusted text.
+
+Python's ``re`` is a backtracking engine: alternations and nested optional
+groups can degrade badly on adversarial input such as hostile article HTML.
+When the optional ``google-re2`` package is installed, patterns compiled
+here use RE2's automaton engine, which guarantees time linear in the input.
+Without it — or for patterns RE2 cannot express, such as lookarounds and
+backreferences — they fall back to the stdlib ``re`` transparently.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+try:
+    import re2 as _re2  # type: ignore[import-not-found]
+except ImportError:
+    _re2 = None
+
+# Flags we can express as inline modifiers understood by both engines
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+def compile_linear(pattern: str, flags: int = 0) -> Any:
+    """Compile ``pattern`` with RE2 when available, else with ``re``.
+
+    The returned object supports the usual ``search``/``findall``/
+    ``finditer``/``sub`` methods either way.
+    """
+    if _re2 is not None:
+        inline = "".join(ch for flag, ch in _INLINE_FLAGS if flags & flag)
+        try:
+            return _re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except _re2.error:
+            log.debug("RE2 cannot compile %r; using re", pattern[:60])
+    return re.compile(pattern, flags)
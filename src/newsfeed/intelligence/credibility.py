@@ -31,13 +31,18 @@ class CredibilityTracker:
         self._bonus_per = scoring.get("corroboration_bonus_per_source", 0.08)
         self._bonus_cap = scoring.get("corroboration_bonus_cap", 0.20)
 
+    @property
+    def tiers(self) -> SourceTiers:
+        """The shared source→tier lookup backing this tracker."""
+        return self._tiers
+
     def _init_source(self, source_id: str) -> SourceReliability:
-        base = self._tiers.base_reliability(source_id)
+        rec = self._tiers.record(source_id)
         return SourceReliability(
             source_id=source_id,
-            reliability_score=base,
-            bias_rating=self._tiers.bias(source_id),
-            historical_accuracy=base,
+            reliability_score=rec.base_reliability,
+            bias_rating=rec.bias,
+            historical_accuracy=rec.base_reliability,
             corroboration_rate=0.5,
         )
 
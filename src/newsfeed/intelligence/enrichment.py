@@ -13,6 +13,7 @@ Two summarization modes:
 """
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import re
@@ -21,9 +22,11 @@ import time
 import urllib.error
 import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import unescape as _html_unescape
 from typing import Any
 from urllib.parse import urlparse
 
+from newsfeed.intelligence._linear_re import compile_linear
 from newsfeed.models.domain import CandidateItem
 
 log = logging.getLogger(__name__)
@@ -38,11 +41,13 @@ _NAV_RE = re.compile(
     r"<(nav|header|footer|aside|form|menu|iframe|noscript)[^>]*>.*?</\1>",
     re.DOTALL | re.IGNORECASE,
 )
+_ARTICLE_RE = re.compile(r"<article[^>]*>(.*?)</article>", re.DOTALL | re.IGNORECASE)
+_PARAGRAPH_RE = re.compile(r"<p[^>]*>(.*?)</p>", re.DOTALL | re.IGNORECASE)
 _WHITESPACE_RE = re.compile(r"\n{3,}")
 _SENTENCE_END_RE = re.compile(r"[.!?]\s")
 
 # Common boilerplate patterns to strip
-_BOILERPLATE = re.compile(
+_BOILERPLATE = compile_linear(
     r"(cookie|subscribe|sign up|newsletter|advertisement|read more|"
     r"share this|follow us|related articles|recommended|most popular|"
     r"copyright \d{4}|all rights reserved|terms of service|privacy policy|"
@@ -54,7 +59,38 @@ _BOILERPLATE = re.compile(
 )
 
 
-def extract_article_text(html_content: str) -> str:
+
+def _bytes_twin(pattern: re.Pattern[str]) -> re.Pattern[bytes]:
+    """Compile an ASCII-only str pattern for use on raw ``bytes``."""
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+
+
+# Tag-structure patterns applied to undecoded page bytes (see extract_article_text)
+_NOISE_RES = (_SCRIPT_RE, _STYLE_RE, _COMMENT_RE, _NAV_RE)
+_NOISE_RES_B = tuple(_bytes_twin(p) for p in _NOISE_RES)
+_ARTICLE_RE_B = _bytes_twin(_ARTICLE_RE)
+_PARAGRAPH_RE_B = _bytes_twin(_PARAGRAPH_RE)
+_TAG_RE_B = _bytes_twin(_TAG_RE)
+
+
+def _decode_html(raw: bytes) -> str:
+    """Decode page bytes as UTF-8, falling back to latin-1.
+
+    A multi-byte character split by the read cap at the very end of the
+    buffer is dropped rather than forcing the whole page to latin-1.
+    """
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.start >= len(raw) - 3:
+            try:
+                return raw[:e.start].decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+        return raw.decode("latin-1", errors="replace")
+
+
+def extract_article_text(html_content: str | bytes, target_chars: int | None = None) -> str:
     """Extract clean article text from raw HTML.
 
     Uses a lightweight readability-style approach:
@@ -62,24 +98,49 @@ def extract_article_text(html_content: str) -> str:
     2. Extract text from <p> and <article> tags (main content)
     3. Fall back to full text extraction if <p> tags yield too little
     4. Filter out boilerplate paragraphs
+
+    When ``target_chars`` is given, paragraph cleaning stops once about four
+    times that much text is collected — enough headroom for the summarizer
+    to pick from without decoding the whole of a very long article.
+
+    ``html_content`` may be the raw page bytes: noise stripping and
+    <article>/<p> selection then run on bytes, and only the extracted
+    paragraphs are decoded to text, in one pass with one encoding.
     """
+    text: Any = html_content
+    is_bytes = isinstance(html_content, bytes)
+    if is_bytes:
+        noise_res, article_re, paragraph_re, tag_re = (
+            _NOISE_RES_B, _ARTICLE_RE_B, _PARAGRAPH_RE_B, _TAG_RE_B)
+        empty, space = b"", b" "
+        to_str = _decode_html
+    else:
+        noise_res, article_re, paragraph_re, tag_re = (
+            _NOISE_RES, _ARTICLE_RE, _PARAGRAPH_RE, _TAG_RE)
+        empty, space = "", " "
+        to_str = str
+
     # Remove noise
-    text = _SCRIPT_RE.sub("", html_content)
-    text = _STYLE_RE.sub("", text)
-    text = _COMMENT_RE.sub("", text)
-    text = _NAV_RE.sub("", text)
+    for noise_re in noise_res:
+        text = noise_re.sub(empty, text)
 
     # Try to extract from <article> first (most reliable for news sites)
-    article_match = re.search(
-        r"<article[^>]*>(.*?)</article>", text, re.DOTALL | re.IGNORECASE
-    )
+    article_match = article_re.search(text)
     if article_match:
         text = article_match.group(1)
 
     # Extract <p> tag content — the core article paragraphs
-    paragraphs = re.findall(r"<p[^>]*>(.*?)</p>", text, re.DOTALL | re.IGNORECASE)
+    paragraphs = paragraph_re.findall(text)
+
+    if paragraphs and is_bytes:
+        # Paragraph bodies never contain "</p>", so it can delimit them for a
+        # single decode; the trailing one keeps the buffer end ASCII, so the
+        # split-character trim in _decode_html cannot eat a final character.
+        paragraphs = _decode_html(b"</p>".join(paragraphs) + b"</p>").split("</p>")[:-1]
 
     if paragraphs:
+        budget = target_chars * 4 if target_chars else None
+        total_chars = 0
         cleaned = []
         for p in paragraphs:
             p_text = _TAG_RE.sub("", p).strip()
@@ -90,11 +151,14 @@ def extract_article_text(html_content: str) -> str:
             if _BOILERPLATE.search(p_text):
                 continue
             cleaned.append(p_text)
+            total_chars += len(p_text)
+            if budget is not None and total_chars >= budget:
+                break
         if cleaned:
             return "\n\n".join(cleaned)
 
     # Fallback: strip all tags and return raw text
-    raw = _TAG_RE.sub(" ", text)
+    raw = to_str(tag_re.sub(space, text))
     raw = _decode_entities(raw)
     raw = _WHITESPACE_RE.sub("\n\n", raw).strip()
     # Take the middle portion (skip header/footer noise)
@@ -104,18 +168,20 @@ def extract_article_text(html_content: str) -> str:
 
 def _decode_entities(text: str) -> str:
     """Decode HTML entities."""
-    import html
-    text = html.unescape(text)
+    text = _html_unescape(text)
     # Clean up common unicode artifacts
     text = text.replace("\xa0", " ")
     text = text.replace("\u200b", "")
-    text = re.sub(r"  +", " ", text)
+    # Collapse runs of spaces; clean text exits after one C-level scan.
+    # (Not str.split(): the fallback path relies on newlines surviving.)
+    while "  " in text:
+        text = text.replace("  ", " ")
     return text.strip()
 
 
 # ── Article fetching ──────────────────────────────────────────────
 
-_SAFE_FETCH_SCHEMES = frozenset({"http", "https"})
+_SAFE_FETCH_PREFIXES = ("http://", "https://")
 
 # Per-domain rate limiting: avoid hammering the same news site when multiple
 # articles are fetched concurrently.  Minimum 0.5s between requests to any
@@ -125,6 +191,16 @@ _domain_last_access: dict[str, float] = {}
 _DOMAIN_MIN_INTERVAL = 0.5  # seconds
 _DOMAIN_CACHE_MAX = 500  # prevent unbounded growth
 
+# Global cap on in-flight article fetches across all enrichers/threads, so
+# concurrent briefings cannot multiply outbound connections.
+_MAX_CONCURRENT_FETCHES = 8
+_fetch_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_FETCHES)
+
+# Response size caps: we only summarize the first few thousand chars, so
+# never buffer more than 2 MB of a page, and refuse declared bodies > 10 MB.
+_MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+_MAX_CONTENT_LENGTH = 10 * 1024 * 1024
+
 
 def _throttle_domain(url: str) -> None:
     """Sleep if needed to enforce per-domain minimum interval."""
@@ -136,10 +212,12 @@ def _throttle_domain(url: str) -> None:
         if len(_domain_last_access) > _DOMAIN_CACHE_MAX:
             oldest_host = min(_domain_last_access, key=_domain_last_access.get)  # type: ignore[arg-type]
             del _domain_last_access[oldest_host]
-        last = _domain_last_access.get(hostname, 0.0)
+        # Reserve the next free slot for this host while holding the lock, so
+        # concurrent callers get distinct, ordered wake-up times.
         now = time.monotonic()
-        wait = _DOMAIN_MIN_INTERVAL - (now - last)
-        _domain_last_access[hostname] = max(now, last + _DOMAIN_MIN_INTERVAL)
+        scheduled = max(now, _domain_last_access.get(hostname, 0.0) + _DOMAIN_MIN_INTERVAL)
+        _domain_last_access[hostname] = scheduled
+    wait = scheduled - now
     if wait > 0:
         time.sleep(wait)
 
@@ -200,18 +278,37 @@ def _check_fetch_url_ip(url: str) -> bool:
 
 def fetch_article(url: str, timeout: int = 8) -> str:
     """Fetch article HTML from a URL. Returns empty string on failure."""
+    raw = fetch_article_bytes(url, timeout)
+    return _decode_html(raw) if raw else ""
+
+
+def fetch_article_bytes(url: str, timeout: int = 8) -> bytes:
+    """Fetch undecoded article HTML from a URL. Returns b"" on failure.
+
+    Feed the result straight to extract_article_text() to avoid decoding
+    the whole page when only a few paragraphs are kept.
+    """
     if not url or url.startswith("https://example.com"):
-        return ""
+        return b""
     # Only allow http/https — block file://, ftp://, data://, gopher:// etc.
-    scheme = url.split(":", 1)[0].lower().strip() if ":" in url else ""
-    if scheme not in _SAFE_FETCH_SCHEMES:
-        log.debug("Blocked fetch for non-http scheme: %s", scheme)
-        return ""
+    # (lowercased retry only for the rare mixed-case scheme like "HTTPS://")
+    if not (url.startswith(_SAFE_FETCH_PREFIXES)
+            or url[:8].lower().startswith(_SAFE_FETCH_PREFIXES)):
+        log.debug("Blocked fetch for non-http scheme: %s", url[:16])
+        return b""
     # SSRF protection: validate resolved IP is not private/reserved/metadata
     if not _check_fetch_url_ip(url):
         log.warning("Blocked article fetch to non-public IP: %s", url[:120])
-        return ""
+        return b""
+    # Wait for this host's slot before taking a global one, so threads
+    # sleeping on a busy host don't hold capacity other hosts could use
     _throttle_domain(url)
+    with _fetch_slots:
+        return _read_article(url, timeout)
+
+
+def _read_article(url: str, timeout: int) -> bytes:
+    """Perform the HTTP GET for fetch_article_bytes(). Returns b"" on failure."""
     try:
         req = urllib.request.Request(url, headers={
             "User-Agent": "Mozilla/5.0 (compatible; NewsFeed/1.0)",
@@ -220,20 +317,28 @@ def fetch_article(url: str, timeout: int = 8) -> str:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
             content_type = resp.headers.get("Content-Type", "")
             if "html" not in content_type.lower() and "text" not in content_type.lower():
-                return ""
-            raw = resp.read()
-            # Try UTF-8 first, fall back to latin-1
-            try:
-                return raw.decode("utf-8")
-            except UnicodeDecodeError:
-                return raw.decode("latin-1", errors="replace")
+                return b""
+            declared = resp.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > _MAX_CONTENT_LENGTH:
+                log.debug("Skipping oversized article (%s bytes): %s", declared, url[:80])
+                return b""
+            raw = resp.read(_MAX_ARTICLE_BYTES + 1)
+            if len(raw) > _MAX_ARTICLE_BYTES:
+                raw = raw[:_MAX_ARTICLE_BYTES]
+            return raw
     except (urllib.error.URLError, urllib.error.HTTPError, OSError, ValueError) as e:
         log.debug("Article fetch failed for %s: %s", url[:80], e)
-        return ""
+        return b""
 
 
 # ── Extractive summarization ──────────────────────────────────────
 
+_MIN_SUMMARY_PARAGRAPH = 30  # paragraphs shorter than this are never selected
+
+_CAPS_RE = compile_linear(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+_NUM_RE = compile_linear(r"\b\d[\d,.]*\b")
+
+
 def extractive_summary(article_text: str, target_chars: int = 500) -> str:
     """Generate a summary by selecting the most information-dense paragraphs.
 
@@ -250,27 +355,38 @@ def extractive_summary(article_text: str, target_chars: int = 500) -> str:
         return ""
 
     # Score each paragraph for information density
-    scored: list[tuple[float, int, str]] = []
+    n_paras = len(paragraphs)
+    scored: list[tuple[float, int, str, int]] = []
     for i, para in enumerate(paragraphs):
-        if len(para) < 30:
+        para_len = len(para)
+        if para_len < _MIN_SUMMARY_PARAGRAPH:
             continue
-        score = _paragraph_score(para, i, len(paragraphs))
-        scored.append((score, i, para))
-
-    # Sort by score but preserve some ordering (top paragraphs get position boost)
-    scored.sort(key=lambda x: x[0], reverse=True)
+        score = _paragraph_score(para, i, n_paras)
+        scored.append((score, i, para, para_len))
+
+    # Rank by score (top paragraphs get position boost). Every selected
+    # paragraph adds at least _MIN_SUMMARY_PARAGRAPH chars, so no more than
+    # k of them can be taken before the target is met — a partial top-k
+    # selection yields exactly what a full sort would.
+    k = -(-target_chars // _MIN_SUMMARY_PARAGRAPH)
+    if k < len(scored):
+        scored = heapq.nlargest(k, scored, key=lambda x: x[0])
+    else:
+        scored.sort(key=lambda x: x[0], reverse=True)
 
     # Select paragraphs up to target length, then reorder by position
+    overshoot_limit = target_chars * 1.2
+    enough = target_chars * 0.6
     selected: list[tuple[int, str]] = []
-    total = 0
-    for score, idx, para in scored:
-        if total + len(para) > target_chars * 1.2:
+    running_len = 0
+    for _score, idx, para, para_len in scored:
+        if running_len + para_len > overshoot_limit:
             # If we have enough, stop. Allow slight overshoot for coherence.
-            if total >= target_chars * 0.6:
+            if running_len >= enough:
                 break
         selected.append((idx, para))
-        total += len(para)
-        if total >= target_chars:
+        running_len += para_len
+        if running_len >= target_chars:
             break
 
     if not selected:
@@ -281,38 +397,36 @@ def extractive_summary(article_text: str, target_chars: int = 500) -> str:
     selected.sort(key=lambda x: x[0])
 
     result = " ".join(para for _, para in selected)
+    # Joined length is known up front: paragraph chars plus one separator each
+    if running_len + len(selected) - 1 <= target_chars:
+        return result
 
-    # Trim to target at sentence boundary
-    if len(result) > target_chars:
-        cut = result[:target_chars].rfind(". ")
-        if cut > target_chars * 0.5:
-            result = result[:cut + 1]
-        else:
-            result = result[:target_chars - 3] + "..."
-
-    return result
+    # Trim to target at sentence boundary (bounded rfind, no prefix copy)
+    cut = result.rfind(". ", 0, target_chars)
+    if cut > target_chars * 0.5:
+        return result[:cut + 1]
+    return result[:target_chars - 3] + "..."
 
 
 def _paragraph_score(para: str, position: int, total: int) -> float:
     """Score a paragraph for information density."""
-    score = 0.0
-
     # Position: inverted pyramid — first paragraphs are most important
     position_weight = max(0.1, 1.0 - (position / max(total, 1)) * 0.7)
-    score += position_weight * 3.0
+    score = position_weight * 3.0
 
     # Length: prefer substantial paragraphs (50-300 chars)
-    if 50 < len(para) < 300:
+    para_len = len(para)
+    if 50 < para_len < 300:
         score += 1.0
-    elif len(para) >= 300:
+    elif para_len >= 300:
         score += 0.5
 
     # Named entities: capitalized multi-word phrases suggest proper nouns
-    caps = len(re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", para))
+    caps = len(_CAPS_RE.findall(para))
     score += min(2.0, caps * 0.3)
 
     # Numbers: dates, statistics, amounts indicate factual content
-    numbers = len(re.findall(r"\b\d[\d,.]*\b", para))
+    numbers = len(_NUM_RE.findall(para))
     score += min(1.5, numbers * 0.3)
 
     # Quotes: direct quotes carry source attribution
@@ -328,6 +442,10 @@ def _paragraph_score(para: str, position: int, total: int) -> float:
 
 # ── LLM-backed summarization ─────────────────────────────────────
 
+# Article text sent to an LLM is truncated to this many characters
+_LLM_ARTICLE_CHARS = 4000
+
+
 def llm_summary(
     article_text: str,
     title: str,
@@ -341,8 +459,8 @@ def llm_summary(
     if not api_key or not article_text:
         return extractive_summary(article_text, target_chars)
 
-    # Truncate article to fit in context (keep first ~4000 chars)
-    article_truncated = article_text[:4000]
+    # Truncate article to fit in context
+    article_truncated = article_text[:_LLM_ARTICLE_CHARS]
 
     system_prompt = (
         "You are a news summarizer for a personal intelligence briefing. "
@@ -402,7 +520,7 @@ def gemini_summary(
     if not api_key or not article_text:
         return extractive_summary(article_text, target_chars)
 
-    article_truncated = article_text[:4000]
+    article_truncated = article_text[:_LLM_ARTICLE_CHARS]
 
     prompt = (
         f"You are a news summarizer for a personal intelligence briefing. "
@@ -456,6 +574,162 @@ def gemini_summary(
     return extractive_summary(article_text, target_chars)
 
 
+# ── Batched LLM summarization ────────────────────────────────────
+
+# Per-article output budget in a batched request, and the overall ceiling.
+# Larger batches are split so every article gets its full budget.
+_BATCH_TOKENS_PER_ARTICLE = 300
+_BATCH_MAX_TOKENS = 4096
+_BATCH_MAX_ARTICLES = _BATCH_MAX_TOKENS // _BATCH_TOKENS_PER_ARTICLE
+_BATCH_TIMEOUT = 30
+
+
+def _batch_prompt(articles: list[tuple[str, str, str]], target_chars: int) -> tuple[str, str]:
+    """Build (instructions, articles_block) for a multi-article summary request.
+
+    ``articles`` is a list of (article_text, title, source) tuples.
+    """
+    instructions = (
+        "You are a news summarizer for a personal intelligence briefing. "
+        "You will receive several numbered articles. For each one, write a "
+        f"concise but complete summary of about {target_chars} characters — "
+        "enough that the reader does NOT need to click through. Include key "
+        "facts, names, numbers, and quotes. Write in plain prose, no bullet points. "
+        'Respond with ONLY a JSON object mapping each article number (as a string) '
+        'to its summary, e.g. {"0": "...", "1": "..."}.'
+    )
+    blocks = [
+        f"[{i}] \"{title}\" from {source}\n\n{text[:_LLM_ARTICLE_CHARS]}"
+        for i, (text, title, source) in enumerate(articles)
+    ]
+    return instructions, "\n\n---\n\n".join(blocks)
+
+
+def _parse_batch_response(text: str, count: int) -> dict[int, str]:
+    """Parse a ``{"index": "summary"}`` JSON reply. Returns {} if unparseable."""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start < 0 or end <= start:
+        return {}
+    try:
+        data = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    summaries: dict[int, str] = {}
+    for key, value in data.items():
+        try:
+            idx = int(key)
+        except (TypeError, ValueError):
+            continue
+        if 0 <= idx < count and isinstance(value, str) and len(value.strip()) > 50:
+            summaries[idx] = value.strip()
+    return summaries
+
+
+def llm_batch_summary(
+    articles: list[tuple[str, str, str]],
+    api_key: str,
+    model: str = "claude-sonnet-4-5-20250929",
+    base_url: str = "https://api.anthropic.com/v1",
+    target_chars: int = 500,
+    timeout: float = _BATCH_TIMEOUT,
+) -> dict[int, str]:
+    """Summarize several articles in one Anthropic request.
+
+    Returns {article_index: summary} for every summary the model produced;
+    missing or unparseable entries are simply absent so the caller can fall
+    back to per-article summarization.
+    """
+    if not api_key or not articles:
+        return {}
+    instructions, articles_block = _batch_prompt(articles, target_chars)
+    max_tokens = min(_BATCH_MAX_TOKENS, _BATCH_TOKENS_PER_ARTICLE * len(articles))
+
+    try:
+        body = json.dumps({
+            "model": model,
+            "max_tokens": max_tokens,
+            "system": instructions,
+            "messages": [{"role": "user", "content": articles_block}],
+        }).encode("utf-8")
+
+        req = urllib.request.Request(
+            f"{base_url}/messages",
+            data=body,
+            headers={
+                "Content-Type": "application/json",
+                "x-api-key": api_key,
+                "anthropic-version": "2023-06-01",
+            },
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            result = json.loads(resp.read().decode("utf-8"))
+
+        text = result.get("content", [{}])[0].get("text", "")
+        return _parse_batch_response(text, len(articles))
+
+    except (urllib.error.URLError, json.JSONDecodeError, OSError, KeyError, IndexError) as e:
+        log.warning("Anthropic batch summary failed for %d articles: %s", len(articles), e)
+    return {}
+
+
+def gemini_batch_summary(
+    articles: list[tuple[str, str, str]],
+    api_key: str,
+    model: str = "gemini-2.0-flash",
+    target_chars: int = 500,
+    timeout: float = _BATCH_TIMEOUT,
+) -> dict[int, str]:
+    """Summarize several articles in one Gemini request.
+
+    Same contract as :func:`llm_batch_summary`.
+    """
+    if not api_key or not articles:
+        return {}
+    instructions, articles_block = _batch_prompt(articles, target_chars)
+    max_tokens = min(_BATCH_MAX_TOKENS, _BATCH_TOKENS_PER_ARTICLE * len(articles))
+
+    url = (
+        f"https://generativelanguage.googleapis.com/v1beta/models/{model}"
+        f":generateContent"
+    )
+
+    try:
+        body = json.dumps({
+            "contents": [{"parts": [{"text": f"{instructions}\n\n{articles_block}"}]}],
+            "generationConfig": {
+                "maxOutputTokens": max_tokens,
+                "temperature": 0.3,
+                "responseMimeType": "application/json",
+            },
+        }).encode("utf-8")
+
+        req = urllib.request.Request(
+            url,
+            data=body,
+            headers={
+                "Content-Type": "application/json",
+                "x-goog-api-key": api_key,
+            },
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            result = json.loads(resp.read().decode("utf-8"))
+
+        candidates = result.get("candidates", [])
+        if candidates:
+            parts = candidates[0].get("content", {}).get("parts", [])
+            if parts:
+                return _parse_batch_response(parts[0].get("text", ""), len(articles))
+
+    except (urllib.error.URLError, json.JSONDecodeError, OSError, KeyError, IndexError) as e:
+        log.warning("Gemini batch summary failed for %d articles: %s", len(articles), e)
+    return {}
+
+
 # ── Batch enrichment (the public API) ────────────────────────────
 
 class ArticleEnricher:
@@ -533,7 +807,9 @@ class ArticleEnricher:
     def enrich(self, candidates: list[CandidateItem]) -> list[CandidateItem]:
         """Fetch articles and replace RSS teasers with real summaries.
 
-        Fetches and summarizes articles in parallel for speed. The entire
+        Fetches articles in parallel for speed. With an LLM backend the
+        fetched articles are summarized in batched requests; without
+        one each article is summarized extractively as it arrives. The entire
         enrichment stage is capped at 60 seconds — any articles not finished
         by the deadline keep their original RSS descriptions.
         """
@@ -541,6 +817,7 @@ class ArticleEnricher:
             return candidates
 
         STAGE_DEADLINE_S = 60  # hard cap for entire enrichment stage
+        deadline = time.monotonic() + STAGE_DEADLINE_S
 
         # Check cache first — skip fetching URLs we already have summaries for
         cache_hits = 0
@@ -555,26 +832,31 @@ class ArticleEnricher:
             else:
                 to_fetch.append(c)
 
-        # Parallel fetch + summarize (combined per article to avoid sequential bottleneck)
+        # With an LLM backend, fetch in parallel and summarize all articles in
+        # one batched request; otherwise fetch + summarize per article.
+        batch_mode = bool(self._gemini_api_key or self._llm_api_key) and len(to_fetch) > 1
+        worker = self._fetch_text if batch_mode else self._fetch_and_summarize
+        fetched: list[tuple[CandidateItem, str]] = []
         enriched_count = 0
         skipped_deadline = 0
         if to_fetch:
             with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
                 futures = {
-                    pool.submit(self._fetch_and_summarize, c): c
+                    pool.submit(worker, c): c
                     for c in to_fetch
                 }
                 try:
                     for future in as_completed(futures, timeout=STAGE_DEADLINE_S):
                         c = futures[future]
                         try:
-                            summary = future.result()
-                            if summary and len(summary) > len(c.summary):
-                                c.summary = summary
-                                self._put_cached_summary(c.url, summary)
-                                enriched_count += 1
+                            result = future.result()
                         except Exception:
-                            pass  # keep original RSS description
+                            continue  # keep original RSS description
+                        if batch_mode:
+                            if result:
+                                fetched.append((c, result))
+                        elif self._apply_summary(c, result):
+                            enriched_count += 1
                 except TimeoutError:
                     skipped_deadline = sum(1 for f in futures if not f.done())
                     log.warning(
@@ -584,22 +866,119 @@ class ArticleEnricher:
                     for f in futures:
                         f.cancel()
 
+                if fetched:
+                    summaries = self._summarize_batch(fetched, pool, deadline)
+                    for (c, _text), summary in zip(fetched, summaries):
+                        if self._apply_summary(c, summary):
+                            enriched_count += 1
+
         log.info(
             "Article enrichment: %d/%d enriched, %d cache hits",
             enriched_count, len(candidates), cache_hits,
         )
         return candidates
 
-    def _fetch_and_summarize(self, c: CandidateItem) -> str:
-        """Fetch a single article and summarize it. Returns summary or empty string."""
-        raw_html = fetch_article(c.url, self._fetch_timeout)
+    def _apply_summary(self, c: CandidateItem, summary: str) -> bool:
+        """Replace the candidate's teaser if ``summary`` is longer, and cache it."""
+        if summary and len(summary) > len(c.summary):
+            c.summary = summary
+            self._put_cached_summary(c.url, summary)
+            return True
+        return False
+
+    def _fetch_text(self, c: CandidateItem) -> str:
+        """Fetch a single article and extract its text. Returns empty string on failure."""
+        raw_html = fetch_article_bytes(c.url, self._fetch_timeout)
         if not raw_html:
             return ""
-        article_text = extract_article_text(raw_html)
+        # LLM backends read up to _LLM_ARTICLE_CHARS, so extract enough for them
+        extract_target = self._target_chars
+        if self._gemini_api_key or self._llm_api_key:
+            extract_target = max(extract_target, _LLM_ARTICLE_CHARS // 4)
+        article_text = extract_article_text(raw_html, extract_target)
         if len(article_text) < 100:
             return ""
+        return article_text
+
+    def _fetch_and_summarize(self, c: CandidateItem) -> str:
+        """Fetch a single article and summarize it. Returns summary or empty string."""
+        article_text = self._fetch_text(c)
+        if not article_text:
+            return ""
         return self._summarize(article_text, c.title, c.source)
 
+    def _summarize_batch(
+        self,
+        fetched: list[tuple[CandidateItem, str]],
+        pool: ThreadPoolExecutor,
+        deadline: float,
+    ) -> list[str]:
+        """Summarize fetched articles in batched LLM requests on ``pool``.
+
+        Articles are sent in chunks of at most ``_BATCH_MAX_ARTICLES`` so each
+        one gets its full output budget. Articles the batch replies do not
+        cover fall back to per-article summarization. Nothing waits past the
+        stage ``deadline`` (a ``time.monotonic()`` value); articles still
+        unsummarized then get "" and keep their RSS descriptions.
+        """
+        articles = [(text, c.title, c.source) for c, text in fetched]
+        summaries = [""] * len(articles)
+
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            futures = {
+                pool.submit(self._batch_request, articles[start:start + _BATCH_MAX_ARTICLES],
+                            min(_BATCH_TIMEOUT, remaining)): start
+                for start in range(0, len(articles), _BATCH_MAX_ARTICLES)
+            }
+            try:
+                for future in as_completed(futures, timeout=remaining):
+                    start = futures[future]
+                    try:
+                        by_index = future.result()
+                    except Exception:
+                        continue  # its articles fall back below
+                    for i, summary in by_index.items():
+                        summaries[start + i] = summary
+            except TimeoutError:
+                for f in futures:
+                    f.cancel()
+
+        missing = [i for i, summary in enumerate(summaries) if not summary]
+        if not missing:
+            return summaries
+        log.info("Batch summary covered %d/%d articles; summarizing rest individually",
+                 len(articles) - len(missing), len(articles))
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            futures = {pool.submit(self._summarize, *articles[i]): i for i in missing}
+            try:
+                for future in as_completed(futures, timeout=remaining):
+                    try:
+                        summaries[futures[future]] = future.result()
+                    except Exception:
+                        continue  # keep original RSS description
+            except TimeoutError:
+                for f in futures:
+                    f.cancel()
+        unsummarized = sum(1 for summary in summaries if not summary)
+        if unsummarized and time.monotonic() >= deadline:
+            log.warning("Enrichment deadline hit during summarization: %d articles skipped",
+                        unsummarized)
+        return summaries
+
+    def _batch_request(self, articles: list[tuple[str, str, str]], timeout: float) -> dict[int, str]:
+        """Send one batched summary request to the configured LLM backend."""
+        if self._gemini_api_key:
+            return gemini_batch_summary(
+                articles, self._gemini_api_key, self._gemini_model, self._target_chars,
+                timeout=timeout,
+            )
+        return llm_batch_summary(
+            articles, self._llm_api_key, self._llm_model, self._llm_base_url,
+            self._target_chars, timeout=timeout,
+        )
+
     def _summarize(self, article_text: str, title: str, source: str) -> str:
         """Generate a summary using the best available backend."""
         if self._gemini_api_key:
@@ -8,8 +8,13 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+from newsfeed.intelligence._linear_re import compile_linear
+
 
 # ── Known entities for high-confidence matching ──
 
@@ -44,8 +49,42 @@ _COUNTRIES = frozenset({
     "Palestine", "Gaza", "Lebanon",
 })
 
+
+def _surface_forms(name: str) -> tuple[str, ...]:
+    """Spellings of a known entity accepted in text.
+
+    Names match exactly. Acronyms of four or more letters also match in
+    title case ("Nato", "Opec"); shorter ones do not, since "Who", "Us" or
+    "Sec" are ordinary words far more often than they are WHO, US or SEC.
+    """
+    if name.isupper() and len(name) >= 4:
+        return (name, name.title())
+    return (name,)
+
+
+# Canonical name -> result category for every known entity
+_ENTITY_CAT: dict[str, str] = (
+    {n: "people" for n in _WORLD_LEADERS}
+    | {n: "organizations" for n in _MAJOR_ORGS}
+    | {n: "countries" for n in _COUNTRIES}
+)
+
+# Surface form -> canonical name for every known entity
+_KNOWN_FORMS: dict[str, str] = {
+    form: name for name in _ENTITY_CAT for form in _surface_forms(name)
+}
+
+# One scan for all known entities. Longest forms first so "Federal Reserve"
+# wins over "Fed"; the lookarounds reject hits inside words ("EU" in
+# "Europe", "US" in "USB").
+_KNOWN_PATTERN = re.compile(
+    r"(?<![A-Za-z0-9])(?:"
+    + "|".join(re.escape(f) for f in sorted(_KNOWN_FORMS, key=len, reverse=True))
+    + r")(?![A-Za-z0-9])"
+)
+
 # Pattern for capitalized multi-word names (potential entities)
-_NAME_PATTERN = re.compile(
+_NAME_PATTERN = compile_linear(
     r"\b([A-Z][a-z]+(?:\s+(?:(?:al-|bin\s|von\s|de\s|van\s)?[A-Z][a-z]+))+)\b"
 )
 
@@ -64,24 +103,16 @@ def extract_entities(text: str) -> dict[str, set[str]]:
     if not text:
         return result
 
-    # Check known entities first (exact match)
-    for leader in _WORLD_LEADERS:
-        if leader in text:
-            result["people"].add(leader)
+    # Check known entities first (single word-bounded scan)
+    for match in _KNOWN_PATTERN.finditer(text):
+        name = _KNOWN_FORMS[match.group()]
+        result[_ENTITY_CAT[name]].add(name)
 
-    for org in _MAJOR_ORGS:
-        if org in text:
-            result["organizations"].add(org)
-
-    for country in _COUNTRIES:
-        if country in text:
-            result["countries"].add(country)
-
-    # Pattern-based: find capitalized multi-word names not already matched
-    known_all = result["people"] | result["organizations"] | result["countries"]
+    # Pattern-based: find capitalized multi-word names that aren't known
+    # entities (any known name the pattern hits was already matched above)
     for match in _NAME_PATTERN.finditer(text):
         name = match.group(1).strip()
-        if name in known_all:
+        if name in _ENTITY_CAT:
             continue
         # Skip common non-entity phrases
         if _is_noise(name):
@@ -110,6 +141,30 @@ def _is_noise(name: str) -> bool:
     return name in noise
 
 
+@lru_cache(maxsize=256)
+def _entities_for_text(text: str) -> Mapping[str, frozenset[str]]:
+    """Memoized, immutable extract_entities() for briefing item text.
+
+    The cached result is shared by every caller, so it is a read-only view.
+    """
+    return MappingProxyType({cat: frozenset(names) for cat, names in extract_entities(text).items()})
+
+
+def _extract_for_items(
+    items: list, start_index: int = 1,
+) -> list[tuple[int, Mapping[str, frozenset[str]]]]:
+    """Extract entities once per briefing item as [(story_index, entities)].
+
+    Keyed on the item text, so a SITREP followed by the entity dashboard
+    over the same briefing reuses the first pass instead of rescanning.
+    """
+    extracted = []
+    for idx, item in enumerate(items, start=start_index):
+        c = item.candidate
+        extracted.append((idx, _entities_for_text(f"{c.title} {c.summary}")))
+    return extracted
+
+
 def build_entity_map(items: list, start_index: int = 1) -> dict[str, list[int]]:
     """Build entity-to-story-index mapping across briefing items.
 
@@ -118,10 +173,7 @@ def build_entity_map(items: list, start_index: int = 1) -> dict[str, list[int]]:
     """
     entity_stories: dict[str, list[int]] = defaultdict(list)
 
-    for idx, item in enumerate(items, start=start_index):
-        c = item.candidate
-        text = f"{c.title} {c.summary}"
-        entities = extract_entities(text)
+    for idx, entities in _extract_for_items(items, start_index):
         for category in ("people", "organizations", "countries"):
             for entity in entities[category]:
                 entity_stories[entity].append(idx)
@@ -150,10 +202,7 @@ def format_entity_dashboard(items: list) -> dict[str, Any]:
     organizations: dict[str, list[int]] = defaultdict(list)
     countries: dict[str, list[int]] = defaultdict(list)
 
-    for idx, item in enumerate(items, start=1):
-        c = item.candidate
-        text = f"{c.title} {c.summary}"
-        entities = extract_entities(text)
+    for idx, entities in _extract_for_items(items):
         for entity in entities["people"]:
             people[entity].append(idx)
         for entity in entities["organizations"]:
@@ -165,22 +214,27 @@ def format_entity_dashboard(items: list) -> dict[str, Any]:
     # Cap entities to prevent O(n²) connection building with large inputs.
     # Keep only the most-referenced entities (appear in most stories).
     _MAX_ENTITIES_FOR_CONNECTIONS = 50
-    all_entities: dict[str, set[int]] = {}
+    # Each entity maps to an int bitmask where bit i means "appears in story
+    # i+1", so pairwise co-occurrence is a single AND + popcount in C.
+    all_entities: dict[str, int] = {}
     for name, indices in {**people, **organizations, **countries}.items():
-        all_entities[name] = set(indices)
+        mask = 0
+        for idx in indices:
+            mask |= 1 << (idx - 1)
+        all_entities[name] = mask
 
     # If too many entities, keep only top N by story count
     if len(all_entities) > _MAX_ENTITIES_FOR_CONNECTIONS:
-        sorted_ents = sorted(all_entities.items(), key=lambda kv: -len(kv[1]))
+        sorted_ents = sorted(all_entities.items(), key=lambda kv: -kv[1].bit_count())
         all_entities = dict(sorted_ents[:_MAX_ENTITIES_FOR_CONNECTIONS])
 
     connections: list[tuple[str, str, int]] = []
-    entity_names = list(all_entities.keys())
-    for i, name_a in enumerate(entity_names):
-        for name_b in entity_names[i + 1:]:
-            shared = all_entities[name_a] & all_entities[name_b]
-            if len(shared) >= 2:
-                connections.append((name_a, name_b, len(shared)))
+    entity_masks = list(all_entities.items())
+    for i, (name_a, mask_a) in enumerate(entity_masks):
+        for name_b, mask_b in entity_masks[i + 1:]:
+            shared = (mask_a & mask_b).bit_count()
+            if shared >= 2:
+                connections.append((name_a, name_b, shared))
 
     connections.sort(key=lambda x: -x[2])
 
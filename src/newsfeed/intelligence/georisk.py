@@ -1,20 +1,23 @@
 from __future__ import annotations
 
+import heapq
+import re
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Any
 
 from newsfeed.models.domain import CandidateItem, GeoRiskEntry, UrgencyLevel
 
-_DEFAULT_REGIONS: dict[str, list[str]] = {
-    "east_asia": ["china", "taiwan", "japan", "korea", "beijing", "tokyo", "seoul", "pyongyang"],
-    "south_asia": ["india", "pakistan", "bangladesh", "sri_lanka", "delhi", "islamabad"],
-    "middle_east": ["iran", "israel", "saudi", "yemen", "syria", "iraq", "gaza", "lebanon", "tehran"],
-    "europe": ["eu", "nato", "ukraine", "russia", "germany", "france", "uk", "brussels", "moscow", "kyiv"],
-    "africa": ["nigeria", "ethiopia", "kenya", "south_africa", "sahel", "sudan", "congo"],
-    "americas": ["us", "usa", "brazil", "mexico", "canada", "washington", "congress", "fed"],
-    "southeast_asia": ["asean", "philippines", "vietnam", "indonesia", "myanmar", "thailand"],
-    "central_asia": ["kazakhstan", "uzbekistan", "turkmenistan", "afghanistan", "taliban"],
-    "arctic": ["arctic", "greenland", "svalbard", "northern_passage"],
+_DEFAULT_REGIONS: dict[str, tuple[str, ...]] = {
+    "east_asia": ("china", "taiwan", "japan", "korea", "beijing", "tokyo", "seoul", "pyongyang"),
+    "south_asia": ("india", "pakistan", "bangladesh", "sri_lanka", "delhi", "islamabad"),
+    "middle_east": ("iran", "israel", "saudi", "yemen", "syria", "iraq", "gaza", "lebanon", "tehran"),
+    "europe": ("eu", "nato", "ukraine", "russia", "germany", "france", "uk", "brussels", "moscow", "kyiv"),
+    "africa": ("nigeria", "ethiopia", "kenya", "south_africa", "sahel", "sudan", "congo"),
+    "americas": ("us", "usa", "brazil", "mexico", "canada", "washington", "congress", "fed"),
+    "southeast_asia": ("asean", "philippines", "vietnam", "indonesia", "myanmar", "thailand"),
+    "central_asia": ("kazakhstan", "uzbekistan", "turkmenistan", "afghanistan", "taliban"),
+    "arctic": ("arctic", "greenland", "svalbard", "northern_passage"),
 }
 
 _DEFAULT_ESCALATION = frozenset({
@@ -29,6 +32,86 @@ _DEFAULT_DEESCALATION = frozenset({
 })
 
 
+@dataclass(slots=True)
+class _PreparedItem:
+    """A candidate with the derived values assess() needs, computed once."""
+    item: CandidateItem
+    esc_hits: int
+    deesc_hits: int
+    score: float
+
+
+@dataclass(slots=True, frozen=True)
+class _RiskCfg:
+    """Risk-scoring tunables, resolved from config once per index."""
+    base_weight: float = 0.4
+    escalation_per_keyword: float = 0.03
+    volume_per_item: float = 0.02
+    volume_cap: float = 0.15
+    urgency_critical: float = 0.3
+    urgency_breaking: float = 0.2
+    urgency_elevated: float = 0.1
+
+    @classmethod
+    def from_config(cls, cfg: dict[str, Any]) -> _RiskCfg:
+        rw = cfg.get("risk_weights", {})
+        uf = cfg.get("urgency_risk_factor", {})
+        d = cls()
+        return cls(
+            base_weight=rw.get("base", d.base_weight),
+            escalation_per_keyword=rw.get("escalation_per_keyword", d.escalation_per_keyword),
+            volume_per_item=rw.get("volume_per_item", d.volume_per_item),
+            volume_cap=rw.get("volume_cap", d.volume_cap),
+            urgency_critical=uf.get("critical", d.urgency_critical),
+            urgency_breaking=uf.get("breaking", d.urgency_breaking),
+            urgency_elevated=uf.get("elevated", d.urgency_elevated),
+        )
+
+
+_DEFAULT_RISK_CFG = _RiskCfg()
+
+
+def _build_region_scanner(
+    regions: dict[str, tuple[str, ...]],
+) -> tuple[re.Pattern[str], dict[str, frozenset[int]]]:
+    """Compile every region keyword into one substring scanner.
+
+    Returns ``(pattern, keyword_regions)``. The pattern is a zero-width
+    lookahead so ``finditer`` reports, at every text position, the longest
+    keyword starting there; ``keyword_regions`` maps that keyword to the
+    regions (as indices into ``regions``) of all keywords that are its
+    prefixes (and so also match at that position). The union over all hits
+    equals the per-region ``any(kw in text for kw in keywords)`` scan, in one
+    pass over the text.
+    """
+    by_keyword: dict[str, set[int]] = defaultdict(set)
+    for region_id, keywords in enumerate(regions.values()):
+        for kw in keywords:
+            if kw:
+                by_keyword[kw].add(region_id)
+
+    keyword_regions: dict[str, frozenset[int]] = {}
+    for kw in by_keyword:
+        covered: set[int] = set()
+        for other, other_regions in by_keyword.items():
+            if kw.startswith(other):
+                covered |= other_regions
+        keyword_regions[kw] = frozenset(covered)
+
+    if not keyword_regions:
+        return re.compile(r"(?!)"), keyword_regions
+    alternation = "|".join(re.escape(kw) for kw in sorted(keyword_regions, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), keyword_regions
+
+
+def _signal_pattern(keywords: frozenset[str]) -> re.Pattern[str]:
+    """Compile signal keywords into one whole-word alternation, longest first."""
+    if not keywords:
+        return re.compile(r"(?!)")
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
 class GeoRiskIndex:
     # Cap tracked regions — the default config defines ~9 regions,
     # but dynamic detection could create more from custom content.
@@ -37,34 +120,52 @@ class GeoRiskIndex:
     def __init__(self, georisk_cfg: dict[str, Any] | None = None) -> None:
         cfg = georisk_cfg or {}
         self._history: dict[str, float] = {}
-        self._regions: dict[str, list[str]] = cfg.get("regions", _DEFAULT_REGIONS)
-        self._escalation_keywords = frozenset(cfg.get("escalation_keywords", [])) or _DEFAULT_ESCALATION
-        self._deescalation_keywords = frozenset(cfg.get("deescalation_keywords", [])) or _DEFAULT_DEESCALATION
+        regions = cfg.get("regions")
+        self._regions: dict[str, tuple[str, ...]] = (
+            _DEFAULT_REGIONS if regions is None else {r: tuple(kws) for r, kws in regions.items()}
+        )
+        self._region_scanner, self._keyword_regions = _build_region_scanner(self._regions)
+        # Regions are bucketed by index during assess(); "global" catches the rest
+        self._region_names: list[str] = list(self._regions)
+        if "global" not in self._regions:
+            self._region_names.append("global")
+        self._global_id = self._region_names.index("global")
+        # An explicit empty list disables that signal; only a missing key falls back
+        esc = cfg.get("escalation_keywords")
+        deesc = cfg.get("deescalation_keywords")
+        self._escalation_keywords = _DEFAULT_ESCALATION if esc is None else frozenset(esc)
+        self._deescalation_keywords = _DEFAULT_DEESCALATION if deesc is None else frozenset(deesc)
+        # Both keyword sets share one scanner; hits are split by set afterwards
+        self._signal_re = _signal_pattern(self._escalation_keywords | self._deescalation_keywords)
         self._default_previous = cfg.get("default_previous_risk", 0.3)
         self._max_drivers = cfg.get("max_drivers", 5)
-
-        rw = cfg.get("risk_weights", {})
-        self._w_base = rw.get("base", 0.4)
-        self._w_esc_per_kw = rw.get("escalation_per_keyword", 0.03)
-        self._w_vol_per = rw.get("volume_per_item", 0.02)
-        self._w_vol_cap = rw.get("volume_cap", 0.15)
-
-        uf = cfg.get("urgency_risk_factor", {})
-        self._uf_critical = uf.get("critical", 0.3)
-        self._uf_breaking = uf.get("breaking", 0.2)
-        self._uf_elevated = uf.get("elevated", 0.1)
+        has_overrides = "risk_weights" in cfg or "urgency_risk_factor" in cfg
+        self._risk = _RiskCfg.from_config(cfg) if has_overrides else _DEFAULT_RISK_CFG
 
     def assess(self, candidates: list[CandidateItem]) -> list[GeoRiskEntry]:
-        region_items: dict[str, list[CandidateItem]] = defaultdict(list)
+        names = self._region_names
+        buckets: list[list[_PreparedItem]] = [[] for _ in names]
 
         for c in candidates:
-            detected_regions = self._detect_regions(c)
-            c.regions = detected_regions
-            for region in detected_regions:
-                region_items[region].append(c)
+            # Lowercase, scan and score each candidate once; every region
+            # it lands in reuses the same prepared view.
+            text = c.lowered_text()
+            region_ids = self._detect_region_ids(f"{text} {c.topic.lower()}")
+            c.regions = [names[i] for i in region_ids]
+            hits = set(self._signal_re.findall(text))
+            prepared = _PreparedItem(
+                c,
+                len(hits & self._escalation_keywords),
+                len(hits & self._deescalation_keywords),
+                c.composite_score(),
+            )
+            for i in region_ids:
+                buckets[i].append(prepared)
 
         entries: list[GeoRiskEntry] = []
-        for region, items in region_items.items():
+        for region, items in zip(names, buckets):
+            if not items:
+                continue
             risk_level = self._compute_risk(items)
             previous = self._history.get(region, self._default_previous)
             delta = round(risk_level - previous, 3)
@@ -94,56 +195,60 @@ class GeoRiskIndex:
 
         return entries
 
-    def _detect_regions(self, item: CandidateItem) -> list[str]:
-        text = f"{item.title} {item.summary} {item.topic}".lower()
-        regions = []
-        for region, keywords in self._regions.items():
-            if any(kw in text for kw in keywords):
-                regions.append(region)
-        return regions or ["global"]
+    def _detect_region_ids(self, text: str) -> list[int]:
+        """Indices of regions whose keywords occur in ``text`` (already lowercased)."""
+        found: set[int] = set()
+        for match in self._region_scanner.finditer(text):
+            found.update(self._keyword_regions[match.group(1)])
+        if not found:
+            return [self._global_id]
+        # Keep config order — narratives display the first few regions
+        return sorted(found)
+
+    def _detect_regions(self, text: str) -> list[str]:
+        """Regions whose keywords occur in ``text`` (already lowercased)."""
+        return [self._region_names[i] for i in self._detect_region_ids(text)]
 
-    def _compute_risk(self, items: list[CandidateItem]) -> float:
+    def _compute_risk(self, items: list[_PreparedItem]) -> float:
         if not items:
             return 0.0
+        risk = self._risk
 
-        base = sum(c.composite_score() for c in items) / len(items)
-
+        # One pass: running score sum, max urgency factor and net keyword hits
+        total = 0.0
         urgency_factor = 0.0
-        for c in items:
-            if c.urgency == UrgencyLevel.CRITICAL:
-                urgency_factor = max(urgency_factor, self._uf_critical)
-            elif c.urgency == UrgencyLevel.BREAKING:
-                urgency_factor = max(urgency_factor, self._uf_breaking)
-            elif c.urgency == UrgencyLevel.ELEVATED:
-                urgency_factor = max(urgency_factor, self._uf_elevated)
-
-        escalation = 0.0
-        for c in items:
-            text = f"{c.title} {c.summary}".lower()
-            words = set(text.split())
-            esc_hits = len(words & self._escalation_keywords)
-            deesc_hits = len(words & self._deescalation_keywords)
-            escalation += (esc_hits - deesc_hits) * self._w_esc_per_kw
-
-        volume_factor = min(self._w_vol_cap, len(items) * self._w_vol_per)
-
-        return min(1.0, max(0.0, base * self._w_base + urgency_factor + escalation + volume_factor))
-
-    def _extract_drivers(self, items: list[CandidateItem]) -> list[str]:
+        net_hits = 0
+        for p in items:
+            total += p.score
+            urgency = p.item.urgency
+            if urgency is UrgencyLevel.CRITICAL:
+                urgency_factor = max(urgency_factor, risk.urgency_critical)
+            elif urgency is UrgencyLevel.BREAKING:
+                urgency_factor = max(urgency_factor, risk.urgency_breaking)
+            elif urgency is UrgencyLevel.ELEVATED:
+                urgency_factor = max(urgency_factor, risk.urgency_elevated)
+            net_hits += p.esc_hits - p.deesc_hits
+
+        base = total / len(items)
+        escalation = net_hits * risk.escalation_per_keyword
+        volume_factor = min(risk.volume_cap, len(items) * risk.volume_per_item)
+
+        return min(1.0, max(0.0, base * risk.base_weight + urgency_factor + escalation + volume_factor))
+
+    def _extract_drivers(self, items: list[_PreparedItem]) -> list[str]:
         drivers = []
-        sources = {c.source for c in items}
+        sources = {p.item.source for p in items}
         if len(sources) >= 3:
             drivers.append(f"Multi-source coverage ({len(sources)} outlets)")
 
-        for c in sorted(items, key=lambda c: c.composite_score(), reverse=True)[:3]:
-            text = f"{c.title} {c.summary}".lower()
-            words = set(text.split())
-            if words & self._escalation_keywords:
-                drivers.append(f"Escalation signal: {c.title[:60]}")
-            elif words & self._deescalation_keywords:
-                drivers.append(f"De-escalation signal: {c.title[:60]}")
+        for p in heapq.nlargest(3, items, key=lambda p: p.score):
+            title = p.item.title
+            if p.esc_hits:
+                drivers.append(f"Escalation signal: {title[:60]}")
+            elif p.deesc_hits:
+                drivers.append(f"De-escalation signal: {title[:60]}")
             else:
-                drivers.append(f"Activity: {c.title[:60]}")
+                drivers.append(f"Activity: {title[:60]}")
 
         return drivers
 
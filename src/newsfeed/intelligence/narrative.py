@@ -10,10 +10,16 @@ This is the #1 impact improvement identified in human review: the gap between
 """
 from __future__ import annotations
 
+import heapq
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from newsfeed.models.domain import StoryLifecycle, UrgencyLevel
+
 if TYPE_CHECKING:
     from newsfeed.intelligence.credibility import CredibilityTracker
+    from newsfeed.intelligence.source_tiers import SourceTiers
     from newsfeed.models.domain import CandidateItem, UserProfile
 
 
@@ -43,6 +49,9 @@ def _topic_name(topic: str) -> str:
     return _TOPIC_DISPLAY.get(topic, topic.replace("_", " "))
 
 
+# Topics whose strong forward signals are flagged as potentially market-moving
+_MARKET_TOPICS = frozenset({"markets", "crypto", "economics", "trade", "energy"})
+
 _TIER_LABELS = {
     "tier_1": "major wire service",
     "tier_1b": "established international outlet",
@@ -51,35 +60,43 @@ _TIER_LABELS = {
 }
 
 
-def _source_tier_label(source: str, credibility: CredibilityTracker) -> str:
+def _source_tier_label(source: str, tiers: SourceTiers) -> str:
     """Describe source quality in human terms."""
-    if source in credibility._tier1_sources:
-        return _TIER_LABELS["tier_1"]
-    if source in credibility._tier1b_sources:
-        return _TIER_LABELS["tier_1b"]
-    if source in credibility._academic_sources:
-        return _TIER_LABELS["tier_academic"]
-    if source in credibility._tier2_sources:
-        return _TIER_LABELS["tier_2"]
-    return "source"
-
-
-def _urgency_phrase(candidate: CandidateItem) -> str:
+    return _TIER_LABELS.get(tiers.record(source).tier, "source")
+
+
+_URGENCY_PHRASE = {
+    UrgencyLevel.CRITICAL: "critical development",
+    UrgencyLevel.BREAKING: "breaking development",
+    UrgencyLevel.ELEVATED: "notable development",
+    UrgencyLevel.ROUTINE: "development",
+}
+
+_LIFECYCLE_PHRASE = {
+    StoryLifecycle.BREAKING: "New breaking report",
+    StoryLifecycle.DEVELOPING: "Developing story with fresh updates",
+    StoryLifecycle.ONGOING: "Ongoing situation with new details",
+    StoryLifecycle.WANING: "Story activity declining but still relevant",
+    StoryLifecycle.RESOLVED: "Situation appears to be resolving",
+}
+
+
+def _urgency_phrase(urgency: UrgencyLevel) -> str:
     """Convert urgency enum to natural language."""
-    from newsfeed.models.domain import UrgencyLevel
-    return {
-        UrgencyLevel.CRITICAL: "critical development",
-        UrgencyLevel.BREAKING: "breaking development",
-        UrgencyLevel.ELEVATED: "notable development",
-        UrgencyLevel.ROUTINE: "development",
-    }.get(candidate.urgency, "development")
+    return _URGENCY_PHRASE.get(urgency, "development")
+
+
+@lru_cache(maxsize=128)
+def _region_display(region: str) -> str:
+    """Display form of a region id; regions come from a small config set."""
+    return region.replace("_", " ").title()
 
 
 def _region_phrase(regions: list[str]) -> str:
     """Format regions for inline text."""
     if not regions:
         return ""
-    display = [r.replace("_", " ").title() for r in regions[:3]]
+    display = [_region_display(r) for r in regions[:3]]
     if len(display) == 1:
         return display[0]
     if len(display) == 2:
@@ -87,12 +104,20 @@ def _region_phrase(regions: list[str]) -> str:
     return f"{display[0]}, {display[1]}, and {display[2]}"
 
 
-def _corroboration_phrase(candidate: CandidateItem) -> str:
+def _truncate_title(title: str, limit: int = 100) -> str:
+    """Shorten a title to ``limit`` chars, preferring a word boundary."""
+    if len(title) <= limit:
+        return title
+    cut = title.rfind(" ", 0, limit)
+    return title[:cut] + "..." if cut > 40 else title[:limit - 3] + "..."
+
+
+def _corroboration_phrase(corroborated_by: list[str]) -> str:
     """Describe corroboration status."""
-    count = len(candidate.corroborated_by)
+    count = len(corroborated_by)
     if count == 0:
         return ""
-    sources = candidate.corroborated_by[:3]
+    sources = corroborated_by[:3]
     source_str = ", ".join(s.title() for s in sources)
     if count == 1:
         return f"independently confirmed by {source_str}"
@@ -102,6 +127,33 @@ def _corroboration_phrase(candidate: CandidateItem) -> str:
 
 
 # ── Main generators ───────────────────────────────────────────────────────
+#
+# Each public generator is a thin wrapper over a private builder that takes
+# the shared candidate fields as arguments, so generate_all() can read them
+# once for all three sentences.
+
+
+@dataclass(slots=True)
+class NarrativeBlock:
+    """The three narrative sentences for one story."""
+    why: str
+    what_changed: str
+    outlook: str
+
+
+def generate_all(
+    candidate: CandidateItem,
+    credibility: CredibilityTracker,
+    profile: UserProfile | None = None,
+) -> NarrativeBlock:
+    """Generate 'why', 'what changed' and 'outlook' for a candidate in one go."""
+    urgency = candidate.urgency
+    corroborated_by = candidate.corroborated_by
+    return NarrativeBlock(
+        why=_why(candidate, urgency, corroborated_by, credibility, profile),
+        what_changed=_what_changed(candidate, urgency, corroborated_by),
+        outlook=_outlook(candidate, urgency, len(corroborated_by)),
+    )
 
 
 def generate_why(
@@ -113,21 +165,30 @@ def generate_why(
 
     Combines: source quality + topic alignment + corroboration + urgency + regions.
     """
+    return _why(candidate, candidate.urgency, candidate.corroborated_by, credibility, profile)
+
+
+def _why(
+    candidate: CandidateItem,
+    urgency: UrgencyLevel,
+    corroborated_by: list[str],
+    credibility: CredibilityTracker,
+    profile: UserProfile | None,
+) -> str:
     parts: list[str] = []
     topic = _topic_name(candidate.topic)
-    source_label = _source_tier_label(candidate.source, credibility)
-    urgency = _urgency_phrase(candidate)
+    source_label = _source_tier_label(candidate.source, credibility.tiers)
+    urgency_text = _urgency_phrase(urgency)
     source_name = candidate.source.title()
 
     # Opening: source + urgency + topic
-    from newsfeed.models.domain import UrgencyLevel
-    if candidate.urgency in (UrgencyLevel.CRITICAL, UrgencyLevel.BREAKING):
-        parts.append(f"{urgency.title()} in {topic} from {source_name} ({source_label})")
+    if urgency in (UrgencyLevel.CRITICAL, UrgencyLevel.BREAKING):
+        parts.append(f"{urgency_text.title()} in {topic} from {source_name} ({source_label})")
     else:
-        parts.append(f"This {source_name} report covers a {urgency} in {topic}")
+        parts.append(f"This {source_name} report covers a {urgency_text} in {topic}")
 
     # Corroboration
-    corr = _corroboration_phrase(candidate)
+    corr = _corroboration_phrase(corroborated_by)
     if corr:
         parts[-1] += f", {corr}"
 
@@ -159,34 +220,33 @@ def generate_what_changed(
     credibility: CredibilityTracker,
 ) -> str:
     """Generate a specific 'what changed' sentence using lifecycle + corroboration."""
-    from newsfeed.models.domain import StoryLifecycle, UrgencyLevel
+    return _what_changed(candidate, candidate.urgency, candidate.corroborated_by)
 
+
+def _what_changed(
+    candidate: CandidateItem,
+    urgency: UrgencyLevel,
+    corroborated_by: list[str],
+) -> str:
     parts: list[str] = []
 
     # Lifecycle-driven opener
-    lifecycle_phrases = {
-        StoryLifecycle.BREAKING: "New breaking report",
-        StoryLifecycle.DEVELOPING: "Developing story with fresh updates",
-        StoryLifecycle.ONGOING: "Ongoing situation with new details",
-        StoryLifecycle.WANING: "Story activity declining but still relevant",
-        StoryLifecycle.RESOLVED: "Situation appears to be resolving",
-    }
-    parts.append(lifecycle_phrases.get(candidate.lifecycle, "New report"))
+    parts.append(_LIFECYCLE_PHRASE.get(candidate.lifecycle, "New report"))
 
     # Corroboration change
-    corr_count = len(candidate.corroborated_by)
+    corr_count = len(corroborated_by)
     if corr_count >= 3:
         parts.append(f"now confirmed across {corr_count} independent sources")
     elif corr_count == 2:
         parts.append("cross-source confirmation strengthening")
     elif corr_count == 1:
-        src = candidate.corroborated_by[0].title()
+        src = corroborated_by[0].title()
         parts.append(f"secondary reporting from {src}")
     else:
         parts.append("single-source report, awaiting confirmation")
 
     # Urgency escalation signal
-    if candidate.urgency in (UrgencyLevel.BREAKING, UrgencyLevel.CRITICAL):
+    if urgency in (UrgencyLevel.BREAKING, UrgencyLevel.CRITICAL):
         parts.append("urgency elevated above baseline")
 
     # Novelty signal
@@ -203,8 +263,10 @@ def generate_outlook(
     credibility: CredibilityTracker,
 ) -> str:
     """Generate a specific 'predictive outlook' sentence using prediction signals."""
-    from newsfeed.models.domain import UrgencyLevel
+    return _outlook(candidate, candidate.urgency, len(candidate.corroborated_by))
+
 
+def _outlook(candidate: CandidateItem, urgency: UrgencyLevel, corr_count: int) -> str:
     parts: list[str] = []
 
     # Prediction signal interpretation
@@ -217,11 +279,11 @@ def generate_outlook(
         parts.append("Limited forward indicators at this time")
 
     # Urgency trajectory
-    if candidate.urgency == UrgencyLevel.CRITICAL:
+    if urgency == UrgencyLevel.CRITICAL:
         parts.append("monitor for rapid escalation")
-    elif candidate.urgency == UrgencyLevel.BREAKING:
+    elif urgency == UrgencyLevel.BREAKING:
         parts.append("watch for follow-on developments within hours")
-    elif candidate.urgency == UrgencyLevel.ELEVATED:
+    elif urgency == UrgencyLevel.ELEVATED:
         parts.append("elevated watch priority for coming days")
 
     # Evidence strength as confidence qualifier
@@ -231,13 +293,11 @@ def generate_outlook(
         parts.append("limited evidence — outlook may shift rapidly")
 
     # Market/narrative signal for relevant topics
-    market_topics = {"markets", "crypto", "economics", "trade", "energy"}
-    if candidate.topic in market_topics and ps >= 0.5:
+    if candidate.topic in _MARKET_TOPICS and ps >= 0.5:
         parts.append("potential market-moving implications")
 
     # Corroboration as conviction signal
-    corr = len(candidate.corroborated_by)
-    if corr >= 3:
+    if corr_count >= 3:
         parts.append("high multi-source conviction")
 
     return ". ".join(parts) + "."
@@ -267,11 +327,7 @@ def generate_adjacent_reads(
             if sibling.source == candidate.source:
                 continue
             # Build a readable recommendation
-            title = sibling.title
-            if len(title) > 100:
-                cut = title[:100].rfind(" ")
-                title = title[:cut] + "..." if cut > 40 else title[:97] + "..."
-            reads.append(f"{title} [{sibling.source}]")
+            reads.append(f"{_truncate_title(sibling.title)} [{sibling.source}]")
             seen_ids.add(sibling.candidate_id)
             if len(reads) >= limit:
                 return reads
@@ -282,14 +338,10 @@ def generate_adjacent_reads(
             c for c in reserve_candidates
             if c.topic == candidate.topic and c.candidate_id not in seen_ids
         ]
-        # Sort by composite score — show the best reserves
-        topic_matches.sort(key=lambda c: c.composite_score(), reverse=True)
-        for c in topic_matches:
-            title = c.title
-            if len(title) > 100:
-                cut = title[:100].rfind(" ")
-                title = title[:cut] + "..." if cut > 40 else title[:97] + "..."
-            reads.append(f"{title} [{c.source}]")
+        # Only the best few reserves (by composite score) can be shown
+        best = heapq.nlargest(limit - len(reads), topic_matches, key=lambda c: c.composite_score())
+        for c in best:
+            reads.append(f"{_truncate_title(c.title)} [{c.source}]")
             seen_ids.add(c.candidate_id)
             if len(reads) >= limit:
                 return reads
@@ -9,9 +9,11 @@ Usage:
     base = tiers.base_reliability("reuters")  # 0.85
     priority = tiers.priority("reuters")       # 0.95
     tier = tiers.tier_name("reuters")          # "tier_1"
+    rec = tiers.record("reuters")              # SourceRecord(tier="tier_1", ...)
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 
@@ -38,6 +40,15 @@ _DEFAULT_PRIORITY = {
 }
 
 
+@dataclass(slots=True, frozen=True)
+class SourceRecord:
+    """Everything the tier registry knows about one source."""
+    tier: str
+    base_reliability: float
+    priority: float
+    bias: str
+
+
 class SourceTiers:
     """Unified source tier registry loaded from pipeline config."""
 
@@ -64,24 +75,39 @@ class SourceTiers:
         self._bias_profiles = cfg.get("bias_profiles", _DEFAULT_BIAS)
         self._priority = cfg.get("source_priority", _DEFAULT_PRIORITY)
 
+        # Flat per-source record (tier, base reliability, priority, bias) so
+        # every accessor is a single dict lookup. Bias and priority tables may
+        # name sources outside any tier, so the record covers all three.
+        self._unknown = SourceRecord("unknown", self._unknown_base, 0.50, "unrated")
+        self._record: dict[str, SourceRecord] = {}
+        for src in self._source_to_tier.keys() | self._bias_profiles.keys() | self._priority.keys():
+            tier = self._source_to_tier.get(src)
+            self._record[src] = SourceRecord(
+                tier or "unknown",
+                self._tier_base.get(tier, self._unknown_base) if tier else self._unknown_base,
+                self._priority.get(src, 0.50),
+                self._bias_profiles.get(src, "unrated"),
+            )
+
+    def record(self, source_id: str) -> SourceRecord:
+        """Return all tier data for a source in one lookup."""
+        return self._record.get(source_id, self._unknown)
+
     def tier_name(self, source_id: str) -> str:
         """Return the tier name for a source, or 'unknown'."""
-        return self._source_to_tier.get(source_id, "unknown")
+        return self._record.get(source_id, self._unknown).tier
 
     def base_reliability(self, source_id: str) -> float:
         """Return the base reliability score for a source."""
-        tier = self._source_to_tier.get(source_id)
-        if tier:
-            return self._tier_base.get(tier, self._unknown_base)
-        return self._unknown_base
+        return self._record.get(source_id, self._unknown).base_reliability
 
     def priority(self, source_id: str) -> float:
         """Return the priority score for a source (used by orchestrator)."""
-        return self._priority.get(source_id, 0.50)
+        return self._record.get(source_id, self._unknown).priority
 
     def bias(self, source_id: str) -> str:
         """Return the bias rating for a source."""
-        return self._bias_profiles.get(source_id, "unrated")
+        return self._record.get(source_id, self._unknown).bias
 
     def sources_in_tier(self, tier_name: str) -> frozenset[str]:
         """Return all sources in a given tier."""
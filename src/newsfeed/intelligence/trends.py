@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
 from datetime import datetime, timedelta, timezone
 
 from newsfeed.models.domain import CandidateItem, TrendSnapshot
@@ -20,20 +20,24 @@ class TrendDetector:
     def analyze(self, candidates: list[CandidateItem]) -> list[TrendSnapshot]:
         now = datetime.now(timezone.utc)
 
-        topic_counts: dict[str, int] = defaultdict(int)
-        topic_recent: dict[str, int] = defaultdict(int)
-        topic_scores: dict[str, list[float]] = defaultdict(list)
+        # One pass: each topic gets an integer slot in parallel count lists
+        topic_index: dict[str, int] = {}
+        topic_counts: list[int] = []
+        topic_recent: list[int] = []
+        window = self.window
 
         for c in candidates:
-            topic_counts[c.topic] += 1
-            topic_scores[c.topic].append(c.composite_score())
-            if now - c.created_at <= self.window:
-                topic_recent[c.topic] += 1
+            i = topic_index.get(c.topic)
+            if i is None:
+                i = topic_index[c.topic] = len(topic_counts)
+                topic_counts.append(0)
+                topic_recent.append(0)
+            topic_counts[i] += 1
+            if now - c.created_at <= window:
+                topic_recent[i] += 1
 
         snapshots: list[TrendSnapshot] = []
-        for topic in topic_counts:
-            total = topic_counts[topic]
-            recent = topic_recent[topic]
+        for topic, total, recent in zip(topic_index, topic_counts, topic_recent):
             velocity = recent / max(total, 1)
 
             baseline = self._baseline.get(topic, 0.3)
@@ -43,9 +47,8 @@ class TrendDetector:
             anomaly_score = velocity / max(baseline, 0.1)
             is_emerging = anomaly_score >= self.anomaly_threshold and total >= 2
 
-            self._baseline[topic] = round(
-                baseline * self.baseline_decay + velocity * (1 - self.baseline_decay), 4
-            )
+            # Keep full precision; only the emitted snapshot is rounded
+            self._baseline[topic] = baseline * self.baseline_decay + velocity * (1 - self.baseline_decay)
 
             snapshots.append(TrendSnapshot(
                 topic=topic,
@@ -59,9 +62,8 @@ class TrendDetector:
         # Evict stale topics when baseline grows too large
         if len(self._baseline) > self._MAX_TOPICS:
             # Drop the topics with lowest baseline velocity (least active)
-            sorted_topics = sorted(self._baseline.items(), key=lambda kv: kv[1])
             excess = len(self._baseline) - self._MAX_TOPICS
-            for topic_key, _ in sorted_topics[:excess]:
+            for topic_key, _ in heapq.nsmallest(excess, self._baseline.items(), key=lambda kv: kv[1]):
                 del self._baseline[topic_key]
 
         snapshots.sort(key=lambda t: t.anomaly_score, reverse=True)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -19,6 +18,11 @@ _DEFAULT_ELEVATED_KEYWORDS = frozenset({
     "disruption", "shortage", "scandal", "indictment",
 })
 
+# Urgency signals are scored as integer ranks so the strongest one is a
+# plain int max; _LEVELS maps a rank back to its UrgencyLevel.
+_ROUTINE, _ELEVATED, _BREAKING, _CRITICAL = range(4)
+_LEVELS = (UrgencyLevel.ROUTINE, UrgencyLevel.ELEVATED, UrgencyLevel.BREAKING, UrgencyLevel.CRITICAL)
+
 
 class BreakingDetector:
     def __init__(
@@ -47,17 +51,35 @@ class BreakingDetector:
     def assess(self, candidates: list[CandidateItem]) -> list[CandidateItem]:
         now = datetime.now(timezone.utc)
         topic_velocity = self._compute_velocity(candidates, now)
+        recency_cutoff = now - self.recency_window
 
-        for c in candidates:
-            keyword_urgency = self._keyword_urgency(c)
-            velocity_urgency = self._velocity_urgency(c.topic, topic_velocity)
-            source_urgency = self._source_count_urgency(c, candidates)
-            recency_urgency = self._recency_urgency(c, now)
+        # Bound once: the loop below runs per candidate
+        velocity_of = topic_velocity.get
+        velocity_urgency = self._velocity_urgency
+        source_count_urgency = self._source_count_urgency
+        recency_urgency = self._recency_urgency
+        keyword_urgency = self._keyword_urgency
+        infer_lifecycle = self._infer_lifecycle
 
-            final = max(keyword_urgency, velocity_urgency, source_urgency, recency_urgency,
-                        key=lambda u: _urgency_rank(u))
-            c.urgency = final
-            c.lifecycle = self._infer_lifecycle(c, topic_velocity)
+        for c in candidates:
+            # Cheapest signals first. Only velocity can reach CRITICAL, and
+            # the others top out at BREAKING, so stop once nothing can raise it.
+            v = velocity_of(c.topic, 0.0)
+            rank = velocity_urgency(v)
+            if rank < _BREAKING:
+                r = source_count_urgency(c)
+                if r > rank:
+                    rank = r
+            if rank < _BREAKING:
+                # Recency only reaches ELEVATED; keyword scan decides BREAKING
+                r = recency_urgency(c, recency_cutoff)
+                if r > rank:
+                    rank = r
+                r = keyword_urgency(c)
+                if r > rank:
+                    rank = r
+            c.urgency = _LEVELS[rank]
+            c.lifecycle = infer_lifecycle(c, v)
 
         return candidates
 
@@ -67,46 +89,51 @@ class BreakingDetector:
         Items with example.com URLs (simulated placeholders) are excluded from
         velocity calculation since their timestamps are synthetic.
         """
-        topic_recent: dict[str, int] = defaultdict(int)
-        topic_total: dict[str, int] = defaultdict(int)
+        # One pass, topics indexed into parallel count lists; the window test
+        # compares against a precomputed cutoff instead of subtracting per item.
+        topic_index: dict[str, int] = {}
+        topic_total: list[int] = []
+        topic_recent: list[int] = []
+        cutoff = now - self.velocity_window
 
         for c in candidates:
             # Skip simulated items — they have default timestamps that inflate velocity
             if "example.com" in (c.url or ""):
                 continue
-            topic_total[c.topic] += 1
-            if now - c.created_at <= self.velocity_window:
-                topic_recent[c.topic] += 1
-
-        velocity: dict[str, float] = {}
-        for topic in topic_total:
-            total = topic_total[topic]
-            recent = topic_recent[topic]
-            velocity[topic] = recent / max(total, 1)
-
-        return velocity
-
-    def _keyword_urgency(self, item: CandidateItem) -> UrgencyLevel:
-        text = f"{item.title} {item.summary}".lower()
-        words = set(text.split())
-
-        if words & self._breaking_keywords:
-            return UrgencyLevel.BREAKING
-        if words & self._elevated_keywords:
-            return UrgencyLevel.ELEVATED
-        return UrgencyLevel.ROUTINE
-
-    def _velocity_urgency(self, topic: str, velocity: dict[str, float]) -> UrgencyLevel:
-        v = velocity.get(topic, 0.0)
+            i = topic_index.get(c.topic)
+            if i is None:
+                i = topic_index[c.topic] = len(topic_total)
+                topic_total.append(0)
+                topic_recent.append(0)
+            topic_total[i] += 1
+            if c.created_at >= cutoff:
+                topic_recent[i] += 1
+
+        return {
+            topic: recent / total
+            for topic, total, recent in zip(topic_index, topic_total, topic_recent)
+        }
+
+    def _keyword_urgency(self, item: CandidateItem) -> int:
+        # Exact whitespace-separated tokens; isdisjoint() takes the word list
+        # directly, so no set is built for the text.
+        words = item.lowered_text().split()
+        if not self._breaking_keywords.isdisjoint(words):
+            return _BREAKING
+        if not self._elevated_keywords.isdisjoint(words):
+            return _ELEVATED
+        return _ROUTINE
+
+    def _velocity_urgency(self, v: float) -> int:
         if v >= self._v_critical:
-            return UrgencyLevel.CRITICAL
+            return _CRITICAL
         if v >= self._v_breaking:
-            return UrgencyLevel.BREAKING
+            return _BREAKING
         if v >= self._v_elevated:
-            return UrgencyLevel.ELEVATED
-        return UrgencyLevel.ROUTINE
+            return _ELEVATED
+        return _ROUTINE
 
-    def _source_count_urgency(self, item: CandidateItem, all_candidates: list[CandidateItem]) -> UrgencyLevel:
+    def _source_count_urgency(self, item: CandidateItem) -> int:
         """Check how many independent sources corroborate THIS specific story.
 
         Uses the corroborated_by field (set by detect_cross_corroboration which
@@ -115,19 +142,17 @@ class BreakingDetector:
         """
         corroborating = len(item.corroborated_by) if item.corroborated_by else 0
         if corroborating >= self.breaking_source_threshold + 1:
-            return UrgencyLevel.BREAKING
+            return _BREAKING
         if corroborating >= self.breaking_source_threshold:
-            return UrgencyLevel.ELEVATED
-        return UrgencyLevel.ROUTINE
+            return _ELEVATED
+        return _ROUTINE
 
-    def _recency_urgency(self, item: CandidateItem, now: datetime) -> UrgencyLevel:
-        age = now - item.created_at
-        if age <= self.recency_window:
-            return UrgencyLevel.ELEVATED
-        return UrgencyLevel.ROUTINE
+    def _recency_urgency(self, item: CandidateItem, cutoff: datetime) -> int:
+        if item.created_at >= cutoff:
+            return _ELEVATED
+        return _ROUTINE
 
-    def _infer_lifecycle(self, item: CandidateItem, velocity: dict[str, float]) -> StoryLifecycle:
-        v = velocity.get(item.topic, 0.0)
+    def _infer_lifecycle(self, item: CandidateItem, v: float) -> StoryLifecycle:
         if item.urgency in (UrgencyLevel.CRITICAL, UrgencyLevel.BREAKING):
             return StoryLifecycle.BREAKING
         if v >= self._v_elevated:
@@ -135,12 +160,3 @@ class BreakingDetector:
         if item.novelty_score < self.waning_novelty_threshold:
             return StoryLifecycle.WANING
         return StoryLifecycle.ONGOING
-
-
-def _urgency_rank(level: UrgencyLevel) -> int:
-    return {
-        UrgencyLevel.ROUTINE: 0,
-        UrgencyLevel.ELEVATED: 1,
-        UrgencyLevel.BREAKING: 2,
-        UrgencyLevel.CRITICAL: 3,
-    }.get(level, 0)
@@ -16,6 +16,21 @@ import sys
 import time
 from typing import Any
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # optional: pip install newsfeed[orjson]
+    orjson = None
+
+
+def _dumps(entry: dict[str, Any]) -> str:
+    """Serialize a log entry, via orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, default=str).decode()
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — stdlib json handles those
+    return json.dumps(entry, default=str)
+
 
 class JSONFormatter(logging.Formatter):
     """Structured JSON log formatter.
@@ -31,10 +46,24 @@ class JSONFormatter(logging.Formatter):
         "authorization", "cookie", "credential",
     })
 
+    # Optional context attributes copied from the record when set
+    _EXTRA_FIELDS = ("request_id", "user_id", "agent_id", "duration_ms", "stage")
+
+    # (whole second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record;
+    # consecutive records mostly share a second, so strftime runs once per second
+    _ts_cache: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        sec = int(record.created)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         entry: dict[str, Any] = {
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
-                  + f".{int(record.msecs):03d}Z",
+            "ts": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
@@ -50,12 +79,12 @@ class JSONFormatter(logging.Formatter):
             entry["error_type"] = type(record.exc_info[1]).__name__
 
         # Add any extra fields from the record
-        for key in ("request_id", "user_id", "agent_id", "duration_ms", "stage"):
+        for key in self._EXTRA_FIELDS:
             val = getattr(record, key, None)
             if val is not None:
                 entry[key] = val
 
-        return json.dumps(entry, default=str)
+        return _dumps(entry)
 
 
 def configure_logging(
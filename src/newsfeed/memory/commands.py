@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from difflib import get_close_matches
+from functools import lru_cache
+from typing import NamedTuple
 
+from newsfeed.intelligence._linear_re import compile_linear
 
-@dataclass(slots=True)
-class PreferenceCommand:
+
+class PreferenceCommand(NamedTuple):
     action: str
     topic: str | None = None
     value: str | None = None
@@ -26,29 +31,118 @@ _VALID_FORMATS = ("bullet", "sections", "narrative")
 _VALID_CADENCES = ("on_demand", "morning", "evening", "realtime")
 
 
-_MORE_RE = re.compile(r"\bmore\s+(.+?)(?=\b(?:and\s+less|less|tone|format|region|cadence)\b|[.,;]|$)", re.IGNORECASE)
-_LESS_RE = re.compile(r"\bless\s+(.+?)(?=\b(?:and\s+more|more|tone|format|region|cadence)\b|[.,;]|$)", re.IGNORECASE)
-_TONE_RE = re.compile(r"\btone\s*[:=]?\s*(concise|analyst|brief|deep|executive)\b", re.IGNORECASE)
-_FORMAT_RE = re.compile(r"\bformat\s*[:=]?\s*(bullet|sections|narrative)\b", re.IGNORECASE)
-_REGION_RE = re.compile(r"\bregion\s*[:=]?\s*(\w[\w\s]*?)(?=\b(?:tone|format|more|less|cadence)\b|[.,;]|$)", re.IGNORECASE)
-_CADENCE_RE = re.compile(r"\bcadence\s*[:=]?\s*(on_demand|morning|evening|realtime)\b", re.IGNORECASE)
-_MAX_ITEMS_RE = re.compile(r"\bmax\s*[:=]?\s*(\d+)\b", re.IGNORECASE)
-_SOURCE_PREFER_RE = re.compile(r"\b(?:prefer|trust|boost)\s+(\w{2,}?)(?:\s+source)?(?=\b|[.,;]|$)", re.IGNORECASE)
-_SOURCE_DEMOTE_RE = re.compile(r"\b(?:demote|distrust|penalize)\s+(\w{2,}?)(?:\s+source)?(?=\b|[.,;]|$)", re.IGNORECASE)
+# Command patterns match against text lowercased once per parse, so they are
+# compiled case-sensitively. They stay on ``re``: RE2's ASCII-only ``\w``,
+# ``\s`` and ``\b`` would change what they capture on non-ASCII input.
+# A topic runs until the next more/less clause or setting keyword, so
+# "more ai and more crypto" yields two topics rather than "ai_and_more_crypto".
+_TOPIC_DELTA_RE = re.compile(
+    r"\b(?P<direction>more|less)\s+(?P<topic>.+?)"
+    r"(?=\b(?:(?:and\s+)?(?:more|less)|tone|format|region|cadence)\b|[.,;]|$)"
+)
+_TONE_RE = re.compile(r"\btone\s*[:=]?\s*(concise|analyst|brief|deep|executive)\b")
+_FORMAT_RE = re.compile(r"\bformat\s*[:=]?\s*(bullet|sections|narrative)\b")
+_REGION_RE = re.compile(r"\bregion\s*[:=]?\s*(\w[\w\s]*?)(?=\b(?:tone|format|more|less|cadence)\b|[.,;]|$)")
+_CADENCE_RE = re.compile(r"\bcadence\s*[:=]?\s*(on_demand|morning|evening|realtime)\b")
+_MAX_ITEMS_RE = re.compile(r"\bmax\s*[:=]?\s*(\d+)\b")
+_SOURCE_PREFER_RE = re.compile(r"\b(?:prefer|trust|boost)\s+(\w{2,}?)(?:\s+source)?(?=\b|[.,;]|$)")
+_SOURCE_DEMOTE_RE = re.compile(r"\b(?:demote|distrust|penalize)\s+(\w{2,}?)(?:\s+source)?(?=\b|[.,;]|$)")
 # Common English words that should NOT be treated as source names
-_SOURCE_NOISE = {"your", "my", "the", "this", "that", "it", "its", "our", "all",
-                 "any", "more", "less", "a", "an", "in", "on", "is", "performance",
-                 "judgment", "judgement"}
-_REMOVE_REGION_RE = re.compile(r"\b(?:remove|drop)\s+region\s*[:=]?\s*(\w[\w\s]*?)(?=\b|[.,;]|$)", re.IGNORECASE)
-_RESET_RE = re.compile(r"\breset\s+(?:all\s+)?preferences?\b", re.IGNORECASE)
+_SOURCE_NOISE = frozenset({"your", "my", "the", "this", "that", "it", "its", "our", "all",
+                           "any", "more", "less", "a", "an", "in", "on", "is", "performance",
+                           "judgment", "judgement"})
+_REMOVE_REGION_RE = re.compile(r"\b(?:remove|drop)\s+region\s*[:=]?\s*(\w[\w\s]*?)(?=\b|[.,;]|$)")
+_RESET_RE = re.compile(r"\breset\s+(?:all\s+)?preferences?\b")
+# Any value after a setting keyword, for fuzzy correction of typos. These run
+# on the original text so corrections can quote what the user typed.
+_RAW_TONE_RE = re.compile(r"\btone\s*[:=]?\s*(\w+)\b", re.IGNORECASE)
+_RAW_FORMAT_RE = re.compile(r"\bformat\s*[:=]?\s*(\w+)\b", re.IGNORECASE)
+_RAW_CADENCE_RE = re.compile(r"\bcadence\s*[:=]?\s*(\w+)\b", re.IGNORECASE)
+
+# Every command pattern above starts with one of these words at a word
+# boundary, so a single scan for them finds every offset where a command can
+# begin. Patterns are then only tried (``match``) at those offsets instead of
+# each re-scanning the whole text; inputs like "more AI" never touch the
+# other command regexes at all.
+# RE2 is safe for this scan: its ASCII word boundaries accept every position
+# ``re`` would, and ``match`` re-checks the real boundary at each offset.
+_TRIGGER_RE = compile_linear(
+    r"\b(more|less|tone|format|region|cadence|max|prefer|trust|boost"
+    r"|demote|distrust|penalize|remove|drop|reset)",
+)
+_TRIGGER_ALIASES = {
+    "trust": "prefer", "boost": "prefer",
+    "distrust": "demote", "penalize": "demote",
+    "drop": "remove",
+}
+
+
+def _trigger_offsets(text: str) -> dict[str, list[int]]:
+    """Start offsets of each canonical trigger word in lowercased ``text``."""
+    offsets: dict[str, list[int]] = {}
+    for m in _TRIGGER_RE.finditer(text):
+        word = m.group(1)
+        offsets.setdefault(_TRIGGER_ALIASES.get(word, word), []).append(m.start())
+    return offsets
+
+
+def _finditer_at(pattern: re.Pattern[str], text: str, offsets: list[int]) -> Iterator[re.Match[str]]:
+    """Equivalent of ``pattern.finditer(text)`` when matches can only start at ``offsets``."""
+    end = 0
+    for pos in offsets:
+        if pos < end:
+            continue  # inside the previous match, which finditer would have consumed
+        m = pattern.match(text, pos)
+        if m:
+            yield m
+            end = m.end()
+
+
+def _first_at(pattern: re.Pattern[str], text: str, offsets: list[int]) -> re.Match[str] | None:
+    """Equivalent of ``pattern.search(text)`` when matches can only start at ``offsets``."""
+    for pos in offsets:
+        m = pattern.match(text, pos)
+        if m:
+            return m
+    return None
+
+
+def _findall_at(pattern: re.Pattern[str], text: str, offsets: list[int]) -> list[str]:
+    """Equivalent of ``pattern.findall(text)`` when matches can only start at ``offsets``."""
+    return [m.group(1) for m in _finditer_at(pattern, text, offsets)]
+
+
+def _topic_deltas(text: str, offsets: dict[str, list[int]]) -> tuple[list[str], list[str]]:
+    """Cleaned (more, less) topics from one scan of ``_TOPIC_DELTA_RE``.
+
+    Topics are interned, like ``CandidateItem.topic``, so the weight dicts
+    they key match candidate topics by identity.
+    """
+    more: list[str] = []
+    less: list[str] = []
+    starts = sorted(offsets.get("more", []) + offsets.get("less", []))
+    for m in _finditer_at(_TOPIC_DELTA_RE, text, starts):
+        topic = _clean_topic(m.group("topic"))
+        if topic:
+            (more if m.group("direction") == "more" else less).append(sys.intern(topic))
+    return more, less
 
 
 def _clean_topic(raw: str) -> str:
-    cleaned = "_".join(raw.strip().lower().split())
-    return cleaned.strip("_")
+    # Callers pass captures from already-lowercased text; split() with no
+    # argument drops surrounding whitespace and collapses inner runs.
+    return "_".join(raw.split()).strip("_")
 
 
-def fuzzy_correct_topic(topic: str, known_topics: set[str],
+# The same typos recur across users and turns, so close-match lookups are
+# cached; difflib scoring otherwise dominates the rich parser.
+@lru_cache(maxsize=2048)
+def _closest(value: str, candidates: frozenset[str] | tuple[str, ...], cutoff: float) -> str | None:
+    matches = get_close_matches(value, candidates, n=1, cutoff=cutoff)
+    return matches[0] if matches else None
+
+
+def fuzzy_correct_topic(topic: str, known_topics: set[str] | frozenset[str],
                         cutoff: float = 0.6) -> tuple[str, str | None]:
     """Fuzzy-match a topic against known topics.
 
@@ -59,9 +153,11 @@ def fuzzy_correct_topic(topic: str, known_topics: set[str],
     """
     if topic in known_topics:
         return topic, None
-    matches = get_close_matches(topic, known_topics, n=1, cutoff=cutoff)
-    if matches:
-        return matches[0], f'Did you mean "{matches[0].replace("_", " ")}"? Applied as "{matches[0].replace("_", " ")}".'
+    if not isinstance(known_topics, frozenset):
+        known_topics = frozenset(known_topics)
+    match = _closest(topic, known_topics, cutoff)
+    if match:
+        return match, f'Did you mean "{match.replace("_", " ")}"? Applied as "{match.replace("_", " ")}".'
     return topic, None
 
 
@@ -71,8 +167,7 @@ def _fuzzy_match_value(raw: str, valid: tuple[str, ...],
     val = raw.strip().lower()
     if val in valid:
         return val
-    matches = get_close_matches(val, valid, n=1, cutoff=cutoff)
-    return matches[0] if matches else None
+    return _closest(val, valid, cutoff)
 
 
 _MAX_INPUT_LEN = 500  # Cap input before regex to prevent ReDoS
@@ -80,58 +175,60 @@ _MAX_INPUT_LEN = 500  # Cap input before regex to prevent ReDoS
 
 def parse_preference_commands(text: str, deltas: dict[str, float] | None = None) -> list[PreferenceCommand]:
     d = deltas or {}
-    more_delta = str(d.get("more", 0.2))
+    # Formatted once per parse and shared by every topic_delta command
+    more_delta = f"+{d.get('more', 0.2)}"
     less_delta = str(d.get("less", -0.2))
 
-    text = text[:_MAX_INPUT_LEN]
+    text = text[:_MAX_INPUT_LEN].lower()
     commands: list[PreferenceCommand] = []
-
-    for m in _MORE_RE.finditer(text):
-        topic = _clean_topic(m.group(1))
-        if topic:
-            commands.append(PreferenceCommand(action="topic_delta", topic=topic, value=f"+{more_delta}"))
-
-    for m in _LESS_RE.finditer(text):
-        topic = _clean_topic(m.group(1))
-        if topic:
-            commands.append(PreferenceCommand(action="topic_delta", topic=topic, value=str(less_delta)))
-
-    tone = _TONE_RE.search(text)
+    triggers = _trigger_offsets(text)
+    if not triggers:
+        return commands
+
+    if "more" in triggers or "less" in triggers:
+        more_topics, less_topics = _topic_deltas(text, triggers)
+        for topic in more_topics:
+            commands.append(PreferenceCommand(action="topic_delta", topic=topic, value=more_delta))
+        for topic in less_topics:
+            commands.append(PreferenceCommand(action="topic_delta", topic=topic, value=less_delta))
+
+    tone = "tone" in triggers and _first_at(_TONE_RE, text, triggers["tone"])
     if tone:
-        commands.append(PreferenceCommand(action="tone", value=tone.group(1).lower()))
+        commands.append(PreferenceCommand(action="tone", value=tone.group(1)))
 
-    fmt = _FORMAT_RE.search(text)
+    fmt = "format" in triggers and _first_at(_FORMAT_RE, text, triggers["format"])
     if fmt:
-        commands.append(PreferenceCommand(action="format", value=fmt.group(1).lower()))
+        commands.append(PreferenceCommand(action="format", value=fmt.group(1)))
 
     # Check remove/drop region FIRST so we can skip _REGION_RE if it matched
-    rm_region = _REMOVE_REGION_RE.search(text)
-    if rm_region:
-        commands.append(PreferenceCommand(action="remove_region", value=_clean_topic(rm_region.group(1))))
-    else:
-        region = _REGION_RE.search(text)
-        if region:
-            commands.append(PreferenceCommand(action="region", value=_clean_topic(region.group(1))))
-
-    cadence = _CADENCE_RE.search(text)
+    if "region" in triggers:
+        rm_region = "remove" in triggers and _first_at(_REMOVE_REGION_RE, text, triggers["remove"])
+        if rm_region:
+            commands.append(PreferenceCommand(action="remove_region", value=_clean_topic(rm_region.group(1))))
+        else:
+            region = _first_at(_REGION_RE, text, triggers["region"])
+            if region:
+                commands.append(PreferenceCommand(action="region", value=_clean_topic(region.group(1))))
+
+    cadence = "cadence" in triggers and _first_at(_CADENCE_RE, text, triggers["cadence"])
     if cadence:
-        commands.append(PreferenceCommand(action="cadence", value=cadence.group(1).lower()))
+        commands.append(PreferenceCommand(action="cadence", value=cadence.group(1)))
 
-    max_items = _MAX_ITEMS_RE.search(text)
+    max_items = "max" in triggers and _first_at(_MAX_ITEMS_RE, text, triggers["max"])
     if max_items:
         commands.append(PreferenceCommand(action="max_items", value=max_items.group(1)))
 
-    for m in _SOURCE_PREFER_RE.finditer(text):
-        src = m.group(1).lower()
-        if src not in _SOURCE_NOISE:
-            commands.append(PreferenceCommand(action="source_boost", topic=src, value="+1.0"))
+    if "prefer" in triggers:
+        for raw in _findall_at(_SOURCE_PREFER_RE, text, triggers["prefer"]):
+            if raw not in _SOURCE_NOISE:
+                commands.append(PreferenceCommand(action="source_boost", topic=sys.intern(raw), value="+1.0"))
 
-    for m in _SOURCE_DEMOTE_RE.finditer(text):
-        src = m.group(1).lower()
-        if src not in _SOURCE_NOISE:
-            commands.append(PreferenceCommand(action="source_demote", topic=src, value="-1.0"))
+    if "demote" in triggers:
+        for raw in _findall_at(_SOURCE_DEMOTE_RE, text, triggers["demote"]):
+            if raw not in _SOURCE_NOISE:
+                commands.append(PreferenceCommand(action="source_demote", topic=sys.intern(raw), value="-1.0"))
 
-    if _RESET_RE.search(text):
+    if "reset" in triggers and _first_at(_RESET_RE, text, triggers["reset"]):
         commands.append(PreferenceCommand(action="reset"))
 
     return commands
@@ -148,38 +245,35 @@ def parse_preference_commands_rich(
     when the user makes typos or uses invalid values.
     """
     text = text[:_MAX_INPUT_LEN]
+    lowered = text.lower()
     d = deltas or {}
-    more_delta = str(d.get("more", 0.2))
+    more_delta = f"+{d.get('more', 0.2)}"
     less_delta = str(d.get("less", -0.2))
-    topics = known_topics or set()
 
     result = ParseResult()
-
-    for m in _MORE_RE.finditer(text):
-        topic = _clean_topic(m.group(1))
-        if topic:
-            corrected, hint = fuzzy_correct_topic(topic, topics)
-            if hint:
-                result.corrections.append(hint)
-            result.commands.append(PreferenceCommand(
-                action="topic_delta", topic=corrected, value=f"+{more_delta}"))
-
-    for m in _LESS_RE.finditer(text):
-        topic = _clean_topic(m.group(1))
-        if topic:
-            corrected, hint = fuzzy_correct_topic(topic, topics)
-            if hint:
-                result.corrections.append(hint)
-            result.commands.append(PreferenceCommand(
-                action="topic_delta", topic=corrected, value=str(less_delta)))
+    triggers = _trigger_offsets(lowered)
+    if not triggers:
+        return result
+    # Frozen once per parse so the cached close-match lookups can key on it
+    topics = frozenset(known_topics or ())
+
+    if "more" in triggers or "less" in triggers:
+        more_topics, less_topics = _topic_deltas(lowered, triggers)
+        for topic_list, delta in ((more_topics, more_delta), (less_topics, less_delta)):
+            for topic in topic_list:
+                corrected, hint = fuzzy_correct_topic(topic, topics)
+                if hint:
+                    result.corrections.append(hint)
+                result.commands.append(PreferenceCommand(
+                    action="topic_delta", topic=corrected, value=delta))
 
     # Tone with fuzzy matching
-    tone_match = _TONE_RE.search(text)
+    tone_match = "tone" in triggers and _first_at(_TONE_RE, lowered, triggers["tone"])
     if tone_match:
-        result.commands.append(PreferenceCommand(action="tone", value=tone_match.group(1).lower()))
-    else:
+        result.commands.append(PreferenceCommand(action="tone", value=tone_match.group(1)))
+    elif "tone" in triggers:
         # Check for "tone:" prefix with invalid value
-        raw_tone = re.search(r"\btone\s*[:=]?\s*(\w+)\b", text, re.IGNORECASE)
+        raw_tone = _RAW_TONE_RE.search(text)
         if raw_tone:
             fuzzy = _fuzzy_match_value(raw_tone.group(1), _VALID_TONES)
             if fuzzy:
@@ -192,11 +286,11 @@ def parse_preference_commands_rich(
                     f'Unknown tone "{raw_tone.group(1)}". Valid: {valid}')
 
     # Format with fuzzy matching
-    fmt_match = _FORMAT_RE.search(text)
+    fmt_match = "format" in triggers and _first_at(_FORMAT_RE, lowered, triggers["format"])
     if fmt_match:
-        result.commands.append(PreferenceCommand(action="format", value=fmt_match.group(1).lower()))
-    else:
-        raw_fmt = re.search(r"\bformat\s*[:=]?\s*(\w+)\b", text, re.IGNORECASE)
+        result.commands.append(PreferenceCommand(action="format", value=fmt_match.group(1)))
+    elif "format" in triggers:
+        raw_fmt = _RAW_FORMAT_RE.search(text)
         if raw_fmt:
             fuzzy = _fuzzy_match_value(raw_fmt.group(1), _VALID_FORMATS)
             if fuzzy:
@@ -209,11 +303,11 @@ def parse_preference_commands_rich(
                     f'Unknown format "{raw_fmt.group(1)}". Valid: {valid}')
 
     # Cadence with fuzzy matching
-    cadence_match = _CADENCE_RE.search(text)
+    cadence_match = "cadence" in triggers and _first_at(_CADENCE_RE, lowered, triggers["cadence"])
     if cadence_match:
-        result.commands.append(PreferenceCommand(action="cadence", value=cadence_match.group(1).lower()))
-    else:
-        raw_cad = re.search(r"\bcadence\s*[:=]?\s*(\w+)\b", text, re.IGNORECASE)
+        result.commands.append(PreferenceCommand(action="cadence", value=cadence_match.group(1)))
+    elif "cadence" in triggers:
+        raw_cad = _RAW_CADENCE_RE.search(text)
         if raw_cad:
             fuzzy = _fuzzy_match_value(raw_cad.group(1), _VALID_CADENCES)
             if fuzzy:
@@ -226,29 +320,30 @@ def parse_preference_commands_rich(
                     f'Unknown cadence "{raw_cad.group(1)}". Valid: {valid}')
 
     # Standard regex-based parsing for the rest
-    rm_region = _REMOVE_REGION_RE.search(text)
-    if rm_region:
-        result.commands.append(PreferenceCommand(action="remove_region", value=_clean_topic(rm_region.group(1))))
-    else:
-        region = _REGION_RE.search(text)
-        if region:
-            result.commands.append(PreferenceCommand(action="region", value=_clean_topic(region.group(1))))
-
-    max_items = _MAX_ITEMS_RE.search(text)
+    if "region" in triggers:
+        rm_region = "remove" in triggers and _first_at(_REMOVE_REGION_RE, lowered, triggers["remove"])
+        if rm_region:
+            result.commands.append(PreferenceCommand(action="remove_region", value=_clean_topic(rm_region.group(1))))
+        else:
+            region = _first_at(_REGION_RE, lowered, triggers["region"])
+            if region:
+                result.commands.append(PreferenceCommand(action="region", value=_clean_topic(region.group(1))))
+
+    max_items = "max" in triggers and _first_at(_MAX_ITEMS_RE, lowered, triggers["max"])
     if max_items:
         result.commands.append(PreferenceCommand(action="max_items", value=max_items.group(1)))
 
-    for m in _SOURCE_PREFER_RE.finditer(text):
-        src = m.group(1).lower()
-        if src not in _SOURCE_NOISE:
-            result.commands.append(PreferenceCommand(action="source_boost", topic=src, value="+1.0"))
+    if "prefer" in triggers:
+        for raw in _findall_at(_SOURCE_PREFER_RE, lowered, triggers["prefer"]):
+            if raw not in _SOURCE_NOISE:
+                result.commands.append(PreferenceCommand(action="source_boost", topic=sys.intern(raw), value="+1.0"))
 
-    for m in _SOURCE_DEMOTE_RE.finditer(text):
-        src = m.group(1).lower()
-        if src not in _SOURCE_NOISE:
-            result.commands.append(PreferenceCommand(action="source_demote", topic=src, value="-1.0"))
+    if "demote" in triggers:
+        for raw in _findall_at(_SOURCE_DEMOTE_RE, lowered, triggers["demote"]):
+            if raw not in _SOURCE_NOISE:
+                result.commands.append(PreferenceCommand(action="source_demote", topic=sys.intern(raw), value="-1.0"))
 
-    if _RESET_RE.search(text):
+    if "reset" in triggers and _first_at(_RESET_RE, lowered, triggers["reset"]):
         result.commands.append(PreferenceCommand(action="reset"))
 
     return result
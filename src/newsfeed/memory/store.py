@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
 import logging
 import math
+import os
 import re
+import sys
 import threading
 import time
-from dataclasses import replace
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import TypeVar
 
 from newsfeed.models.domain import CandidateItem, UserProfile
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # optional: pip install newsfeed[orjson]
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 # ── Bounded per-user cache ───────────────────────────────────────
@@ -22,37 +32,51 @@ log = logging.getLogger(__name__)
 _VT = TypeVar("_VT")
 
 
-class BoundedUserDict(dict[str, _VT]):
+class BoundedUserDict(OrderedDict[str, _VT]):
     """A dict that evicts least-recently-used entries when size exceeds a cap.
 
     Drop-in replacement for ``dict[str, V]`` where keys are user IDs.
     On every __setitem__ the key is moved to the end (most recently used);
     when the population exceeds *maxlen* the oldest entry is evicted.
+
+    Writes are serialized by an internal lock. Owners that already guard
+    every access with their own lock can pass ``synchronized=False`` to
+    skip it.
     """
 
     __slots__ = ("_maxlen", "_lock")
 
-    def __init__(self, maxlen: int = 500, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
+    def __init__(self, maxlen: int = 500, *args, synchronized: bool = True, **kwargs) -> None:
+        # Set before populating: OrderedDict.__init__ routes through __setitem__
         self._maxlen = max(1, maxlen)
-        self._lock = threading.RLock()
+        self._lock = threading.RLock() if synchronized else None
+        super().__init__(*args, **kwargs)
 
     def __setitem__(self, key: str, value: _VT) -> None:
-        with self._lock:
-            # Move existing key to end (refresh) or insert at end
-            if key in self:
-                super().__delitem__(key)
-            super().__setitem__(key, value)
-            # Evict oldest entries if over cap
-            while len(self) > self._maxlen:
-                oldest = next(iter(self))
-                log.info("BoundedUserDict evicting key=%s (cap=%d)", oldest, self._maxlen)
-                super().__delitem__(oldest)
+        if self._lock is None:
+            self._store(key, value)
+        else:
+            with self._lock:
+                self._store(key, value)
+
+    def _store(self, key: str, value: _VT) -> None:
+        # Refresh an existing key in place, or insert at the end
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        # Every insert goes through here, so at most one entry is over the cap
+        if len(self) > self._maxlen:
+            oldest, _ = self.popitem(last=False)
+            log.info("BoundedUserDict evicting key=%s (cap=%d)", oldest, self._maxlen)
 
     def setdefault(self, key: str, default: _VT = None) -> _VT:  # type: ignore[assignment]
+        if self._lock is None:
+            if key not in self:
+                self._store(key, default)  # type: ignore[arg-type]
+            return self[key]
         with self._lock:
             if key not in self:
-                self[key] = default  # type: ignore[assignment]
+                self._store(key, default)  # type: ignore[arg-type]
             return self[key]
 
 # Common stop words to exclude from keyword extraction
@@ -67,12 +91,21 @@ _STOP_WORDS = frozenset({
 })
 
 
+_WORD_RE = re.compile(r"[a-z]+")
+
+
 def extract_keywords(headline: str) -> list[str]:
     """Extract meaningful keywords from a headline for tracking."""
-    words = re.findall(r"[a-zA-Z]+", headline.lower())
+    words = _WORD_RE.findall(headline.lower())
     return [w for w in words if w not in _STOP_WORDS and len(w) > 2]
 
 
+@lru_cache(maxsize=4096)
+def _headline_keywords(headline: str) -> frozenset[str]:
+    # match_tracked sees the same briefing titles once per tracked story
+    return frozenset(extract_keywords(headline))
+
+
 def match_tracked(story_topic: str, story_title: str,
                   tracked: dict) -> bool:
     """Check if a story matches a tracked item.
@@ -86,9 +119,7 @@ def match_tracked(story_topic: str, story_title: str,
     """
     if story_topic != tracked["topic"]:
         return False
-    story_words = set(extract_keywords(story_title))
-    tracked_words = set(tracked["keywords"])
-    overlap = story_words & tracked_words
+    overlap = _headline_keywords(story_title).intersection(tracked["keywords"])
     if len(overlap) >= 2:
         return True
     # Weak match: 1 overlap allowed if the shared keyword is substantial
@@ -106,17 +137,31 @@ class PreferenceStore:
     MAX_USERS = 5000
 
     def __init__(self) -> None:
-        self._profiles: BoundedUserDict[UserProfile] = BoundedUserDict(maxlen=self.MAX_USERS)
+        # Every write to _profiles happens under self._lock, so the dict's
+        # own lock would only be a second acquisition per write.
+        self._profiles: BoundedUserDict[UserProfile] = BoundedUserDict(
+            maxlen=self.MAX_USERS, synchronized=False)
         # RLock allows reentrant locking: methods that already hold the lock
         # (e.g. apply_weight_adjustment) can safely call get_or_create.
         self._lock = threading.RLock()
         self._weight_timestamps: dict[str, dict[str, float]] = {}  # user_id -> {topic: last_updated_ts}
 
     def get_or_create(self, user_id: str) -> UserProfile:
+        # Fast path without the lock: a single dict lookup is atomic under
+        # the GIL, and existing profiles are the common case.
+        profile = self._profiles.get(user_id)
+        if profile is not None:
+            return profile
         with self._lock:
-            if user_id not in self._profiles:
-                self._profiles[user_id] = UserProfile(user_id=user_id)
-            return self._profiles[user_id]
+            return self._get_or_create_unlocked(user_id)
+
+    def _get_or_create_unlocked(self, user_id: str) -> UserProfile:
+        """get_or_create for callers that already hold ``self._lock``."""
+        profile = self._profiles.get(user_id)
+        if profile is None:
+            profile = UserProfile(user_id=user_id)
+            self._profiles[user_id] = profile
+        return profile
 
     def _bump_version(self, profile: UserProfile) -> None:
         """Increment the optimistic concurrency version after a mutation."""
@@ -155,7 +200,7 @@ class PreferenceStore:
         the cap was hit or the weight saturated, or empty string otherwise.
         """
         with self._lock:
-            profile = self.get_or_create(user_id)
+            profile = self._get_or_create_unlocked(user_id)
             current = profile.topic_weights.get(topic, 0.0)
             # Reject new entries if at cap (updates to existing keys are always allowed)
             if topic not in profile.topic_weights and len(profile.topic_weights) >= self.MAX_WEIGHTS:
@@ -212,7 +257,7 @@ class PreferenceStore:
         the cap was hit or the weight saturated, or empty string otherwise.
         """
         with self._lock:
-            profile = self.get_or_create(user_id)
+            profile = self._get_or_create_unlocked(user_id)
             current = profile.source_weights.get(source, 0.0)
             if source not in profile.source_weights and len(profile.source_weights) >= self.MAX_WEIGHTS:
                 self._prune_zero_weights(profile.source_weights)
@@ -233,8 +278,10 @@ class PreferenceStore:
 
     def remove_region(self, user_id: str, region: str) -> UserProfile:
         profile = self.get_or_create(user_id)
-        if region in profile.regions_of_interest:
+        try:  # one scan, rather than `in` followed by remove()
             profile.regions_of_interest.remove(region)
+        except ValueError:
+            pass
         self._bump_version(profile)
         return profile
 
@@ -273,8 +320,10 @@ class PreferenceStore:
 
     def unmute_topic(self, user_id: str, topic: str) -> UserProfile:
         profile = self.get_or_create(user_id)
-        if topic in profile.muted_topics:
+        try:
             profile.muted_topics.remove(topic)
+        except ValueError:
+            pass
         self._bump_version(profile)
         return profile
 
@@ -290,7 +339,9 @@ class PreferenceStore:
             if match_tracked(topic, headline, existing):
                 return profile  # already tracking
         profile.tracked_stories.append({
-            "topic": topic,
+            # Interned like CandidateItem.topic, so match_tracked's != check
+            # usually resolves on identity
+            "topic": sys.intern(topic),
             "keywords": keywords,
             "headline": headline,
             "tracked_at": time.time(),
@@ -449,11 +500,12 @@ class PreferenceStore:
         """Remove a keyword alert. Returns (profile, was_removed)."""
         profile = self.get_or_create(user_id)
         keyword = keyword.strip().lower()
-        if keyword in profile.alert_keywords:
+        try:
             profile.alert_keywords.remove(keyword)
-            self._bump_version(profile)
-            return profile, True
-        return profile, False
+        except ValueError:
+            return profile, False
+        self._bump_version(profile)
+        return profile, True
 
     def set_email(self, user_id: str, email: str) -> UserProfile:
         """Set the user's email address for digest delivery."""
@@ -474,8 +526,9 @@ class PreferenceStore:
         if len(profile.custom_sources) >= self._MAX_CUSTOM_SOURCES:
             return profile, f"Maximum {self._MAX_CUSTOM_SOURCES} custom sources reached."
         # Check for duplicate names
+        folded = name.lower()
         for src in profile.custom_sources:
-            if src["name"].lower() == name.lower():
+            if src["name"].lower() == folded:
                 return profile, f"Source '{name}' already exists."
         # Check for duplicate feed URLs
         for src in profile.custom_sources:
@@ -496,8 +549,9 @@ class PreferenceStore:
     def remove_custom_source(self, user_id: str, name: str) -> tuple[UserProfile, bool]:
         """Remove a custom source by name. Returns (profile, was_removed)."""
         profile = self.get_or_create(user_id)
+        folded = name.lower()
         for i, src in enumerate(profile.custom_sources):
-            if src["name"].lower() == name.lower():
+            if src["name"].lower() == folded:
                 profile.custom_sources.pop(i)
                 self._bump_version(profile)
                 return profile, True
@@ -511,7 +565,7 @@ class PreferenceStore:
     def reset(self, user_id: str) -> UserProfile:
         """Reset all user preferences to defaults."""
         with self._lock:
-            profile = self.get_or_create(user_id)
+            profile = self._get_or_create_unlocked(user_id)
             profile.topic_weights.clear()
             profile.source_weights.clear()
             profile.regions_of_interest.clear()
@@ -535,35 +589,36 @@ class PreferenceStore:
             return self._snapshot_unlocked()
 
     def _snapshot_unlocked(self) -> dict[str, dict]:
-        result = {}
-        for uid, p in self._profiles.items():
-            result[uid] = {
-                "topic_weights": dict(p.topic_weights),
-                "source_weights": dict(p.source_weights),
-                "tone": p.tone,
-                "format": p.format,
-                "max_items": p.max_items,
-                "cadence": p.briefing_cadence,
-                "regions": list(p.regions_of_interest),
-                "watchlist_crypto": list(p.watchlist_crypto),
-                "watchlist_stocks": list(p.watchlist_stocks),
-                "timezone": p.timezone,
-                "muted_topics": list(p.muted_topics),
-                "tracked_stories": list(p.tracked_stories),
-                "bookmarks": list(p.bookmarks),
-                "email": p.email,
-                "confidence_min": p.confidence_min,
-                "urgency_min": p.urgency_min,
-                "max_per_source": p.max_per_source,
-                "alert_georisk_threshold": p.alert_georisk_threshold,
-                "alert_trend_threshold": p.alert_trend_threshold,
-                "presets": dict(p.presets),
-                "webhook_url": p.webhook_url,
-                "custom_sources": list(p.custom_sources),
-                "alert_keywords": list(p.alert_keywords),
-                "version": p.version,
-            }
-        return result
+        return {uid: self._profile_snapshot(p) for uid, p in self._profiles.items()}
+
+    @staticmethod
+    def _profile_snapshot(p: UserProfile) -> dict:
+        return {
+            "topic_weights": dict(p.topic_weights),
+            "source_weights": dict(p.source_weights),
+            "tone": p.tone,
+            "format": p.format,
+            "max_items": p.max_items,
+            "cadence": p.briefing_cadence,
+            "regions": list(p.regions_of_interest),
+            "watchlist_crypto": list(p.watchlist_crypto),
+            "watchlist_stocks": list(p.watchlist_stocks),
+            "timezone": p.timezone,
+            "muted_topics": list(p.muted_topics),
+            "tracked_stories": list(p.tracked_stories),
+            "bookmarks": list(p.bookmarks),
+            "email": p.email,
+            "confidence_min": p.confidence_min,
+            "urgency_min": p.urgency_min,
+            "max_per_source": p.max_per_source,
+            "alert_georisk_threshold": p.alert_georisk_threshold,
+            "alert_trend_threshold": p.alert_trend_threshold,
+            "presets": dict(p.presets),
+            "webhook_url": p.webhook_url,
+            "custom_sources": list(p.custom_sources),
+            "alert_keywords": list(p.alert_keywords),
+            "version": p.version,
+        }
 
     # ── Cross-session persistence ────────────────────────────────
     # PreferenceStore is backed by BoundedUserDict which is ephemeral.
@@ -602,6 +657,27 @@ class PreferenceStore:
         result = list(value or [])
         return result[-cap:] if len(result) > cap else result
 
+    # Persisted key -> (profile attribute, fallback) for plain string fields
+    _RESTORE_STR_FIELDS = (
+        ("tone", "tone", "concise"),
+        ("format", "format", "bullet"),
+        ("cadence", "briefing_cadence", "on_demand"),
+        ("email", "email", ""),
+        ("urgency_min", "urgency_min", ""),
+        ("webhook_url", "webhook_url", ""),
+    )
+    # Persisted key -> (profile attribute, max length) for list fields
+    _RESTORE_LIST_FIELDS = (
+        ("regions", "regions_of_interest", 20),
+        ("watchlist_crypto", "watchlist_crypto", MAX_WATCHLIST_SIZE),
+        ("watchlist_stocks", "watchlist_stocks", MAX_WATCHLIST_SIZE),
+        ("muted_topics", "muted_topics", MAX_MUTED_TOPICS),
+        ("tracked_stories", "tracked_stories", 20),
+        ("bookmarks", "bookmarks", 50),
+        ("custom_sources", "custom_sources", 10),
+        ("alert_keywords", "alert_keywords", 50),
+    )
+
     def restore(self, storage: StatePersistence, key: str = "preferences") -> int:
         """Restore profiles from persistent storage. Returns count restored."""
         data = storage.load(key)
@@ -616,7 +692,7 @@ class PreferenceStore:
             for uid, profile_data in data.items():
                 if not isinstance(uid, str) or not isinstance(profile_data, dict):
                     continue
-                profile = self.get_or_create(uid)
+                profile = self._get_or_create_unlocked(uid)
                 # Weight dicts — cap at MAX_WEIGHTS entries
                 tw = dict(profile_data.get("topic_weights") or {})
                 if len(tw) > self.MAX_WEIGHTS:
@@ -626,20 +702,13 @@ class PreferenceStore:
                 if len(sw) > self.MAX_WEIGHTS:
                     sw = dict(list(sw.items())[:self.MAX_WEIGHTS])
                 profile.source_weights = sw
-                profile.tone = str(profile_data.get("tone") or "concise")
-                profile.format = str(profile_data.get("format") or "bullet")
+                for src, attr, fallback in self._RESTORE_STR_FIELDS:
+                    setattr(profile, attr, str(profile_data.get(src) or fallback))
+                for src, attr, cap in self._RESTORE_LIST_FIELDS:
+                    setattr(profile, attr, self._capped_list(profile_data.get(src), cap))
                 profile.max_items = self._safe_int(profile_data.get("max_items"), 10)
-                profile.briefing_cadence = str(profile_data.get("cadence") or "on_demand")
-                profile.regions_of_interest = self._capped_list(profile_data.get("regions"), 20)
-                profile.watchlist_crypto = self._capped_list(profile_data.get("watchlist_crypto"), self.MAX_WATCHLIST_SIZE)
-                profile.watchlist_stocks = self._capped_list(profile_data.get("watchlist_stocks"), self.MAX_WATCHLIST_SIZE)
                 profile.timezone = str(profile_data.get("timezone") or "UTC")[:self._MAX_TIMEZONE_LEN]
-                profile.muted_topics = self._capped_list(profile_data.get("muted_topics"), self.MAX_MUTED_TOPICS)
-                profile.tracked_stories = self._capped_list(profile_data.get("tracked_stories"), 20)
-                profile.bookmarks = self._capped_list(profile_data.get("bookmarks"), 50)
-                profile.email = str(profile_data.get("email") or "")
                 profile.confidence_min = max(0.0, min(1.0, self._safe_float(profile_data.get("confidence_min"), 0.0)))
-                profile.urgency_min = str(profile_data.get("urgency_min") or "")
                 profile.max_per_source = max(0, min(10, self._safe_int(profile_data.get("max_per_source"), 0)))
                 profile.alert_georisk_threshold = max(0.1, min(1.0, self._safe_float(profile_data.get("alert_georisk_threshold"), 0.5)))
                 profile.alert_trend_threshold = max(1.5, min(10.0, self._safe_float(profile_data.get("alert_trend_threshold"), 3.0)))
@@ -648,9 +717,6 @@ class PreferenceStore:
                 if isinstance(presets, dict) and len(presets) > 10:
                     presets = dict(list(presets.items())[:10])
                 profile.presets = dict(presets) if isinstance(presets, dict) else {}
-                profile.webhook_url = str(profile_data.get("webhook_url") or "")
-                profile.custom_sources = self._capped_list(profile_data.get("custom_sources"), 10)
-                profile.alert_keywords = self._capped_list(profile_data.get("alert_keywords"), 50)
                 profile.version = self._safe_int(profile_data.get("version"), 0)
                 restored += 1
         log.info("Restored %d user profiles from persistent storage", restored)
@@ -721,8 +787,7 @@ class PreferenceStore:
             profile = self._profiles.get(user_id)
             if not profile:
                 return None
-            snapshot = self._snapshot_unlocked()
-            return snapshot.get(user_id)
+            return self._profile_snapshot(profile)
 
     def delete_user_data(self, user_id: str) -> bool:
         """Delete all data for a user (GDPR Article 17 — right to erasure).
@@ -747,6 +812,9 @@ class CandidateCache:
 
     def __init__(self, stale_after_minutes: int = 180) -> None:
         self._entries: dict[str, list[CandidateItem]] = {}
+        # Oldest created_at per slot, so reads can skip the per-item
+        # staleness scan while nothing in the slot has expired yet.
+        self._oldest: dict[str, datetime] = {}
         self.stale_after = timedelta(minutes=stale_after_minutes)
         self._eviction_counter = 0
 
@@ -754,19 +822,36 @@ class CandidateCache:
         return f"{user_id}:{topic}"
 
     def put(self, user_id: str, topic: str, candidates: list[CandidateItem]) -> None:
-        self._entries[self.key(user_id, topic)] = candidates
+        cache_key = self.key(user_id, topic)
+        self._entries[cache_key] = candidates
+        if candidates:
+            self._oldest[cache_key] = min(c.created_at for c in candidates)
+        else:
+            self._oldest.pop(cache_key, None)
         self._eviction_counter += 1
         if self._eviction_counter >= self._EVICTION_INTERVAL:
             self._evict_stale()
             self._eviction_counter = 0
 
     def get_fresh(self, user_id: str, topic: str) -> list[CandidateItem]:
-        now = datetime.now(timezone.utc)
-        fresh: list[CandidateItem] = []
-        for c in self._entries.get(self.key(user_id, topic), []):
-            if now - c.created_at <= self.stale_after:
-                fresh.append(c)
-        return fresh
+        cache_key = self.key(user_id, topic)
+        candidates = self._entries.get(cache_key)
+        if not candidates:
+            return []
+        cutoff = datetime.now(timezone.utc) - self.stale_after
+        oldest = self._oldest.get(cache_key)
+        if oldest is not None and oldest >= cutoff:
+            return list(candidates)
+        # Something expired, or the slot wasn't filled through put(): filter
+        # once and keep only the fresh items, since stale candidates never
+        # become fresh again.
+        fresh = [c for c in candidates if c.created_at >= cutoff]
+        self._entries[cache_key] = fresh
+        if fresh:
+            self._oldest[cache_key] = min(c.created_at for c in fresh)
+        else:
+            self._oldest.pop(cache_key, None)
+        return list(fresh)
 
     def get_all_fresh(self, user_id: str) -> list[CandidateItem]:
         """Get all fresh candidates across all topics for a user."""
@@ -780,11 +865,13 @@ class CandidateCache:
                         fresh.append(c)
         return fresh
 
-    def get_more(self, user_id: str, topic: str, already_seen_ids: set[str], limit: int) -> list[CandidateItem]:
+    def get_more(self, user_id: str, topic: str, already_seen_ids: set[str] | frozenset[str],
+                 limit: int) -> list[CandidateItem]:
+        if not isinstance(already_seen_ids, (set, frozenset)):
+            already_seen_ids = set(already_seen_ids)  # keep the per-candidate check O(1)
         candidates = self.get_fresh(user_id, topic)
-        unseen = [replace(c) for c in candidates if c.candidate_id not in already_seen_ids]
-        unseen.sort(key=lambda c: c.composite_score(), reverse=True)
-        return unseen[:limit]
+        unseen = [c for c in candidates if c.candidate_id not in already_seen_ids]
+        return heapq.nlargest(limit, unseen, key=CandidateItem.composite_score)
 
     def _evict_stale(self) -> None:
         """Remove fully stale entries and enforce max slot cap.
@@ -801,6 +888,7 @@ class CandidateCache:
                 to_remove.append(cache_key)
         for cache_key in to_remove:
             del self._entries[cache_key]
+            self._oldest.pop(cache_key, None)
 
         # Enforce hard cap by dropping oldest slots
         if len(self._entries) > self._MAX_SLOTS:
@@ -811,11 +899,23 @@ class CandidateCache:
             overshoot = len(self._entries) - self._MAX_SLOTS
             for k in sorted_keys[:overshoot]:
                 del self._entries[k]
+                self._oldest.pop(k, None)
 
         if to_remove:
             log.debug("Cache eviction: removed %d stale slots, %d remaining", len(to_remove), len(self._entries))
 
 
+def _null_non_finite(value: object) -> object:
+    """Copy of a JSON-like value with NaN/inf floats replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _null_non_finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_null_non_finite(v) for v in value]
+    return value
+
+
 class StatePersistence:
     # Only alphanumeric + underscore/hyphen allowed in persistence keys
     _VALID_KEY_RE = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
@@ -823,6 +923,9 @@ class StatePersistence:
     def __init__(self, state_dir: Path) -> None:
         self.state_dir = state_dir
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        # Digest of the bytes last written per key; unchanged snapshots
+        # (e.g. back-to-back preference saves) skip the write and rename.
+        self._written: dict[str, bytes] = {}
 
     def _safe_path(self, key: str) -> Path:
         """Resolve a persistence key to a safe file path.
@@ -840,17 +943,59 @@ class StatePersistence:
 
     def save(self, key: str, data: dict) -> None:
         path = self._safe_path(key)
+        payload = self._encode(data)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._written.get(key) == digest and path.exists():
+            return
         tmp = path.with_suffix(".tmp")
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
-        tmp.rename(path)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        # os.replace overwrites atomically on Windows too, unlike rename
+        os.replace(tmp, path)
+        self._written[key] = digest
 
     def load(self, key: str) -> dict | None:
         path = self._safe_path(key)
         if not path.exists():
             return None
         try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
+            raw = path.read_bytes()
+            if orjson is not None:
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    pass  # NaN or >64-bit ints written by stdlib json; retry below
+            return json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return None
+
+    @staticmethod
+    def _encode(data: dict) -> bytes:
+        """Serialize a snapshot, via orjson when it is installed.
+
+        Either serializer's output loads back to the same data. Datetimes
+        and dataclasses are passed through to ``default=str``, and NaN/inf
+        are written as ``null`` by both. The bytes still differ: orjson
+        writes non-ASCII as raw UTF-8 where json writes ``\\uXXXX``
+        escapes, and orjson serializes plain ``Enum`` members by value.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data, default=str,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+                            | orjson.OPT_PASSTHROUGH_DATACLASS),
+                )
+            except TypeError:
+                pass  # e.g. non-str keys or ints beyond 64 bits
+        try:
+            text = json.dumps(data, indent=2, default=str, allow_nan=False)
+        except ValueError:
+            # Non-finite floats: write them as null, as orjson does
+            text = json.dumps(_null_non_finite(data), indent=2, default=str)
+        return text.encode("utf-8")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
 import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -159,8 +160,18 @@ class ResearchTask:
 _SAFE_URL_SCHEMES = frozenset({"http", "https", "ftp", ""})
 
 
+class _LoweredTextSlot:
+    """Extra slot for CandidateItem's lowered_text() memo.
+
+    Declared on a plain base class so the memo is not a dataclass field and
+    stays out of ``fields()``, ``asdict()``, ``__init__`` and pickles.
+    """
+
+    __slots__ = ("_lowered",)
+
+
 @dataclass(slots=True)
-class CandidateItem:
+class CandidateItem(_LoweredTextSlot):
     candidate_id: str
     title: str
     source: str
@@ -188,6 +199,10 @@ class CandidateItem:
         self.novelty_score = max(0.0, min(1.0, self.novelty_score))
         self.preference_fit = max(0.0, min(1.0, self.preference_fit))
         self.prediction_signal = max(0.0, min(1.0, self.prediction_signal))
+        # Topics and sources come from small closed sets and key many per-batch
+        # dicts downstream; interning lets those lookups match by identity.
+        self.topic = sys.intern(self.topic)
+        self.source = sys.intern(self.source)
         # Enforce max lengths to prevent memory abuse from corrupted feeds
         if len(self.title) > 500:
             self.title = self.title[:500]
@@ -199,6 +214,19 @@ class CandidateItem:
             log.warning("Rejected unsafe URL scheme %r in candidate %s", scheme, self.candidate_id)
             self.url = ""
 
+    def lowered_text(self) -> str:
+        """``"{title} {summary}"`` lowercased, memoised until either field changes.
+
+        Urgency, georisk and keyword-alert matching all scan this same text.
+        """
+        # (title, summary, lowered text); unset until first call
+        memo = getattr(self, "_lowered", None)
+        if memo is not None and memo[0] is self.title and memo[1] is self.summary:
+            return memo[2]
+        text = f"{self.title} {self.summary}".lower()
+        self._lowered = (self.title, self.summary, text)
+        return text
+
     def composite_score(self) -> float:
         weights = _get_scoring().get("composite_weights", {})
         w_ev = weights.get("evidence", 0.30)
@@ -24,9 +24,7 @@ from newsfeed.intelligence.credibility import (
 )
 from newsfeed.intelligence.narrative import (
     generate_adjacent_reads,
-    generate_outlook,
-    generate_what_changed,
-    generate_why,
+    generate_all,
 )
 from newsfeed.intelligence.georisk import GeoRiskIndex
 from newsfeed.intelligence.trends import TrendDetector
@@ -473,7 +471,7 @@ class NewsFeedEngine:
         # Boost stories matching keyword alerts — cross-topic priority boosting
         if profile.alert_keywords:
             for c in all_candidates:
-                text = f"{c.title} {c.summary}".lower()
+                text = c.lowered_text()
                 if any(kw in text for kw in profile.alert_keywords):
                     c.preference_fit = round(min(1.0, c.preference_fit + 0.25), 3)
                     c.novelty_score = round(min(1.0, c.novelty_score + 0.10), 3)
@@ -743,12 +741,9 @@ class NewsFeedEngine:
 
         for c in selected:
             # Generate smart, metadata-driven narrative text
-            why = self.review_stack.refine_why(
-                generate_why(c, self.credibility, profile)
-            )
-            outlook = self.review_stack.refine_outlook(
-                generate_outlook(c, self.credibility)
-            )
+            narrative = generate_all(c, self.credibility, profile)
+            why = self.review_stack.refine_why(narrative.why)
+            outlook = self.review_stack.refine_outlook(narrative.outlook)
 
             # Real adjacent reads from thread siblings and reserve cache
             reads = generate_adjacent_reads(c, threads, reserve, limit=adjacent_count)
@@ -772,7 +767,7 @@ class NewsFeedEngine:
                 ReportItem(
                     candidate=c,
                     why_it_matters=why,
-                    what_changed=generate_what_changed(c, self.credibility),
+                    what_changed=narrative.what_changed,
                     predictive_outlook=outlook,
                     adjacent_reads=reads,
                     confidence=confidence,
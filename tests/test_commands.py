@@ -61,6 +61,50 @@ class CommandParserTests(unittest.TestCase):
         self.assertIn("max_items", actions)
         self.assertIn("tone", actions)
 
+    def test_trigger_aliases_and_case(self) -> None:
+        commands = parse_preference_commands("MORE Crypto, TRUST reuters, Drop Region asia, Tone:Brief")
+        by_action = {c.action: (c.topic, c.value) for c in commands}
+        self.assertEqual(by_action["topic_delta"], ("crypto", "+0.2"))
+        self.assertEqual(by_action["source_boost"], ("reuters", "+1.0"))
+        self.assertEqual(by_action["remove_region"], (None, "asia"))
+        self.assertEqual(by_action["tone"], (None, "brief"))
+        self.assertEqual(parse_preference_commands("just chatting about the news"), [])
+
+    def test_overlapping_and_repeated_commands(self) -> None:
+        commands = parse_preference_commands("more ai max 5 and more crypto, tone brief tone deep")
+        self.assertEqual(commands, [
+            ("topic_delta", "ai_max_5", "+0.2"),
+            ("topic_delta", "crypto", "+0.2"),
+            ("tone", None, "brief"),
+            ("max_items", None, "5"),
+        ])
+
+    def test_repeated_direction_splits_topics(self) -> None:
+        commands = parse_preference_commands("less celebrity news and less sports more ai more crypto")
+        self.assertEqual([(c.topic, c.value) for c in commands], [
+            ("ai", "+0.2"), ("crypto", "+0.2"),
+            ("celebrity_news", "-0.2"), ("sports", "-0.2"),
+        ])
+
+    def test_adjacent_directions_read_once(self) -> None:
+        # One more/less scan: "less crypto" is the topic of "more", not a
+        # second, contradictory clause overlapping it.
+        self.assertEqual(parse_preference_commands("more less crypto"), [
+            ("topic_delta", "less_crypto", "+0.2"),
+        ])
+
+    def test_parsed_topics_and_sources_are_interned(self) -> None:
+        import sys
+        topic_cmd, source_cmd = parse_preference_commands("more " + "quantum computing" + ", prefer " + "reuters")
+        self.assertIs(topic_cmd.topic, sys.intern("quantum_computing"))
+        self.assertIs(source_cmd.topic, sys.intern("reuters"))
+
+    def test_commands_are_immutable_tuples(self) -> None:
+        cmd = parse_preference_commands("tone: brief")[0]
+        self.assertEqual(cmd, ("tone", None, "brief"))
+        with self.assertRaises(AttributeError):
+            cmd.value = "deep"  # type: ignore[misc]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ from newsfeed.intelligence.credibility import (
 from newsfeed.intelligence.clustering import StoryClustering
 from newsfeed.intelligence.urgency import BreakingDetector
 from newsfeed.intelligence.georisk import GeoRiskIndex
+from newsfeed.intelligence.source_tiers import SourceTiers
 from newsfeed.intelligence.trends import TrendDetector
 from newsfeed.models.domain import (
     CandidateItem,
@@ -176,6 +177,40 @@ class UrgencyTests(unittest.TestCase):
         elevated = [c for c in result if c.urgency != UrgencyLevel.ROUTINE]
         self.assertGreater(len(elevated), 0)
 
+    def test_keyword_urgency_matches_exact_tokens_only(self) -> None:
+        detector = BreakingDetector()
+        self.assertEqual(detector._keyword_urgency(_make_candidate(title="War in the north")), 2)
+        self.assertEqual(detector._keyword_urgency(_make_candidate(title="Warsaw summit today")), 1)
+        # Punctuation attached to a keyword keeps it from matching
+        for title in ("War: what now", "war-torn towns", "Port attack.", "Warsaw update"):
+            self.assertEqual(detector._keyword_urgency(_make_candidate(title=title)), 0, title)
+
+    def test_velocity_counts_recent_share_per_topic(self) -> None:
+        items = [
+            _make_candidate(cid="a1", minutes_ago=5),
+            _make_candidate(cid="a2", minutes_ago=90),
+            _make_candidate(cid="b1", topic="markets", minutes_ago=5),
+            _make_candidate(cid="sim", topic="markets", minutes_ago=90),
+        ]
+        for c in items[:3]:
+            c.url = f"https://news.test/{c.candidate_id}"
+        detector = BreakingDetector(velocity_window_minutes=30)
+        velocity = detector._compute_velocity(items, datetime.now(timezone.utc))
+        # The example.com placeholder is excluded from the markets counts
+        self.assertEqual(velocity, {"geopolitics": 0.5, "markets": 1.0})
+
+    def test_keyword_scan_skipped_once_velocity_is_critical(self) -> None:
+        items = [_make_candidate(cid=f"c{i}", minutes_ago=1) for i in range(3)]
+        for c in items:
+            c.url = f"https://news.test/{c.candidate_id}"
+        detector = BreakingDetector()
+        calls = []
+        detector._keyword_urgency = lambda item: calls.append(item) or 0
+        detector.assess(items)
+        self.assertEqual({c.urgency for c in items}, {UrgencyLevel.CRITICAL})
+        self.assertEqual({c.lifecycle for c in items}, {StoryLifecycle.BREAKING})
+        self.assertEqual(calls, [])
+
     def test_lifecycle_set_on_assessment(self) -> None:
         c = _make_candidate(title="Major war escalation begins")
         detector = BreakingDetector()
@@ -183,6 +218,27 @@ class UrgencyTests(unittest.TestCase):
         self.assertIsInstance(c.lifecycle, StoryLifecycle)
 
 
+class SourceTiersTests(unittest.TestCase):
+    def test_accessors_cover_tiered_and_untiered_sources(self) -> None:
+        tiers = SourceTiers({
+            "source_tiers": {"tier_1": {"sources": ["reuters"], "base_reliability": 0.9}},
+            "source_priority": {"reuters": 0.95, "blog": 0.3},
+            "bias_profiles": {"blog": "partisan"},
+        })
+        self.assertEqual(tiers.tier_name("reuters"), "tier_1")
+        self.assertEqual(tiers.base_reliability("reuters"), 0.9)
+        self.assertEqual(tiers.bias("reuters"), "unrated")
+        # Priority/bias-only sources keep unknown tier defaults
+        self.assertEqual(tiers.tier_name("blog"), "unknown")
+        self.assertEqual(tiers.base_reliability("blog"), 0.50)
+        self.assertEqual(tiers.priority("blog"), 0.3)
+        self.assertEqual(tiers.bias("blog"), "partisan")
+        self.assertEqual(tiers.priority("nobody"), 0.50)
+        rec = tiers.record("reuters")
+        self.assertEqual((rec.tier, rec.base_reliability, rec.priority), ("tier_1", 0.9, 0.95))
+        self.assertIs(tiers.record("nobody"), tiers.record("other"))
+
+
 class GeoRiskTests(unittest.TestCase):
     def test_region_detection(self) -> None:
         c = _make_candidate(title="NATO response to Ukraine conflict escalation")
@@ -210,6 +266,38 @@ class GeoRiskTests(unittest.TestCase):
         regions = [r.region for r in risks]
         self.assertIn("global", regions)
 
+    def test_single_pass_region_scan_matches_overlapping_keywords(self) -> None:
+        # "russia" contains "us", "usa" has "us" as a prefix: every region whose
+        # keyword occurs as a substring must be reported, in config order.
+        index = GeoRiskIndex({"regions": {"a": ["us"], "b": ["usa"], "c": ["russia"]}})
+        self.assertEqual(index._detect_regions("russian and usa envoys meet"), ["a", "b", "c"])
+        self.assertEqual(index._detect_regions("russia warns"), ["a", "c"])
+
+    def test_partial_risk_config_keeps_other_defaults(self) -> None:
+        index = GeoRiskIndex({"risk_weights": {"base": 0.9}})
+        self.assertEqual(index._risk.base_weight, 0.9)
+        self.assertEqual(index._risk.volume_cap, 0.15)
+        self.assertEqual(index._risk.urgency_critical, 0.3)
+        self.assertIs(GeoRiskIndex()._risk, GeoRiskIndex()._risk)
+
+    def test_signal_keywords_match_whole_words_once(self) -> None:
+        index = GeoRiskIndex()
+        c = _make_candidate(title="War, war and warships: Iran talks stall")
+        entry = index.assess([c])[0]
+        self.assertTrue(entry.drivers[0].startswith("Escalation signal:"))
+        # "war" counts once, "warships" not at all, "talks" offsets it
+        text = f"{c.title} {c.summary}".lower()
+        hits = set(index._signal_re.findall(text))
+        self.assertEqual(hits & index._escalation_keywords, {"war"})
+        self.assertEqual(hits & index._deescalation_keywords, {"talks"})
+
+    def test_explicit_empty_keyword_list_disables_signal(self) -> None:
+        index = GeoRiskIndex({"escalation_keywords": []})
+        self.assertEqual(index._escalation_keywords, frozenset())
+        entry = index.assess([_make_candidate(title="Iran war fears")])[0]
+        self.assertTrue(entry.drivers[0].startswith("Activity:"))
+        self.assertIs(GeoRiskIndex()._deescalation_keywords, index._deescalation_keywords)
+
     def test_risk_entry_has_drivers(self) -> None:
         c = _make_candidate(title="Russia military mobilization near border")
         index = GeoRiskIndex()
@@ -248,8 +336,34 @@ class TrendTests(unittest.TestCase):
         baseline_2 = detector._baseline.get("geopolitics", 0.0)
         self.assertNotEqual(baseline_1, baseline_2)
 
+    def test_baseline_kept_at_full_precision(self) -> None:
+        detector = TrendDetector()
+        detector._baseline["geopolitics"] = 1 / 3
+        snapshot = detector.analyze([_make_candidate()])[0]
+        decay = detector.baseline_decay
+        self.assertEqual(detector._baseline["geopolitics"], (1 / 3) * decay + 1.0 * (1 - decay))
+        self.assertEqual(snapshot.baseline_velocity, 0.333)
+
 
 class DomainModelTests(unittest.TestCase):
+    def test_lowered_text_memo_follows_field_changes(self) -> None:
+        c = _make_candidate(title="Markets RALLY")
+        self.assertEqual(c.lowered_text(), "markets rally summary for markets rally")
+        self.assertIs(c.lowered_text(), c.lowered_text())
+        c.summary = "Fed Holds"
+        self.assertEqual(c.lowered_text(), "markets rally fed holds")
+
+    def test_lowered_text_memo_is_not_a_field(self) -> None:
+        import copy
+        import dataclasses
+        import pickle
+        c = _make_candidate(title="Markets RALLY")
+        c.lowered_text()
+        self.assertNotIn("_lowered", {f.name for f in dataclasses.fields(c)})
+        self.assertEqual(CandidateItem(**dataclasses.asdict(c)), c)
+        for clone in (copy.copy(c), pickle.loads(pickle.dumps(c))):
+            self.assertEqual(clone.lowered_text(), c.lowered_text())
+
     def test_confidence_band_labels(self) -> None:
         high = ConfidenceBand(low=0.7, mid=0.85, high=0.95)
         self.assertEqual(high.label(), "high confidence")
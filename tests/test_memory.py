@@ -92,10 +92,40 @@ class CandidateCacheTests(unittest.TestCase):
         self.assertNotIn("c0", ids)
         self.assertNotIn("c1", ids)
 
+    def test_get_more_ranks_by_score_and_limits(self) -> None:
+        cache = CandidateCache()
+        candidates = [_make_candidate(cid=f"c{i}") for i in range(4)]
+        for i, c in enumerate(candidates):
+            c.evidence_score = 0.1 * (i + 1)
+        cache.put("u1", "geo", candidates)
+        more = cache.get_more("u1", "geo", already_seen_ids={"c3"}, limit=2)
+        self.assertEqual([c.candidate_id for c in more], ["c2", "c1"])
+        more = cache.get_more("u1", "geo", already_seen_ids=["c2", "c3"], limit=2)  # type: ignore[arg-type]
+        self.assertEqual([c.candidate_id for c in more], ["c1", "c0"])
+
+    def test_entries_set_directly_are_read(self) -> None:
+        cache = CandidateCache(stale_after_minutes=10)
+        old = _make_candidate(cid="old", minutes_ago=60)
+        new = _make_candidate(cid="new", minutes_ago=1)
+        cache._entries[cache.key("u1", "geo")] = [old, new]
+        self.assertEqual([c.candidate_id for c in cache.get_fresh("u1", "geo")], ["new"])
+        self.assertEqual([c.candidate_id for c in cache.get_fresh("u1", "geo")], ["new"])
+
     def test_empty_cache_returns_empty(self) -> None:
         cache = CandidateCache()
         self.assertEqual(cache.get_fresh("nobody", "nothing"), [])
 
+    def test_stale_items_pruned_on_read(self) -> None:
+        cache = CandidateCache(stale_after_minutes=10)
+        old = _make_candidate(cid="old", minutes_ago=60)
+        new = _make_candidate(cid="new", minutes_ago=1)
+        cache.put("u1", "geo", [new, old])
+        self.assertEqual([c.candidate_id for c in cache.get_fresh("u1", "geo")], ["new"])
+        self.assertEqual(len(cache._entries["u1:geo"]), 1)
+        # Returned lists are copies; callers cannot mutate the cached slot
+        cache.get_fresh("u1", "geo").clear()
+        self.assertEqual(len(cache.get_fresh("u1", "geo")), 1)
+
 
 class BoundedUserDictTests(unittest.TestCase):
     def test_basic_get_set(self) -> None:
@@ -129,6 +159,18 @@ class BoundedUserDictTests(unittest.TestCase):
         self.assertNotIn("b", d)
         self.assertEqual(d["a"], 10)
 
+    def test_initial_items_respect_cap(self) -> None:
+        d: BoundedUserDict[int] = BoundedUserDict(2, {"a": 1, "b": 2, "c": 3})
+        self.assertEqual(list(d), ["b", "c"])
+
+    def test_unsynchronized_variant_behaves_the_same(self) -> None:
+        d: BoundedUserDict[int] = BoundedUserDict(maxlen=2, synchronized=False)
+        d["a"] = 1
+        d.setdefault("b", 2)
+        d["a"] = 3
+        d["c"] = 4  # evicts "b"
+        self.assertEqual(dict(d), {"a": 3, "c": 4})
+
     def test_setdefault_works(self) -> None:
         d: BoundedUserDict[set] = BoundedUserDict(maxlen=5)
         s = d.setdefault("u1", set())
@@ -190,6 +232,40 @@ class StatePersistenceTests(unittest.TestCase):
             loaded = sp.load("data")
             self.assertEqual(loaded["x"], 1)
 
+    def test_datetimes_and_big_ints_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sp = StatePersistence(Path(tmpdir))
+            ts = datetime(2026, 2, 17, 18, 4, tzinfo=timezone.utc)
+            sp.save("state", {"ts": ts, "big": 2**70, "name": "Zürich"})
+            self.assertEqual(sp.load("state"), {"ts": str(ts), "big": 2**70, "name": "Zürich"})
+
+    def test_orjson_and_stdlib_output_load_the_same(self) -> None:
+        from unittest.mock import patch
+        from newsfeed.memory import store
+        data = {"name": "Zürich ☃", "score": float("nan"), "vals": [1.5, float("inf")]}
+        expected = {"name": "Zürich ☃", "score": None, "vals": [1.5, None]}
+        backends = [None] + ([store.orjson] if store.orjson is not None else [])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for backend in backends:
+                with patch.object(store, "orjson", backend):
+                    sp = StatePersistence(Path(tmpdir))
+                    sp.save("state", data)
+                self.assertEqual(sp.load("state"), expected)
+
+    def test_unchanged_snapshot_not_rewritten(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sp = StatePersistence(Path(tmpdir))
+            path = Path(tmpdir) / "prefs.json"
+            sp.save("prefs", {"x": 1})
+            path.write_text('{"x": "edited"}', encoding="utf-8")
+            sp.save("prefs", {"x": 1})
+            self.assertEqual(sp.load("prefs"), {"x": "edited"})
+            sp.save("prefs", {"x": 2})
+            self.assertEqual(sp.load("prefs"), {"x": 2})
+            path.unlink()
+            sp.save("prefs", {"x": 2})
+            self.assertEqual(sp.load("prefs"), {"x": 2})
+
     def test_corrupt_json_returns_none(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             sp = StatePersistence(Path(tmpdir))
@@ -14,6 +14,7 @@ from datetime import datetime, timezone
 from newsfeed.intelligence.credibility import CredibilityTracker
 from newsfeed.intelligence.narrative import (
     generate_adjacent_reads,
+    generate_all,
     generate_outlook,
     generate_what_changed,
     generate_why,
@@ -137,6 +138,12 @@ class TestGenerateWhy:
         result = generate_why(c, credibility)
         assert result.endswith(".")
 
+    def test_breaking_names_source_tier(self, credibility):
+        c = _make_candidate(source="reuters", urgency=UrgencyLevel.BREAKING)
+        assert "major wire service" in generate_why(c, credibility)
+        c = _make_candidate(source="unlisted_blog", urgency=UrgencyLevel.BREAKING)
+        assert "(source)" in generate_why(c, credibility)
+
 
 # ══════════════════════════════════════════════════════════════════════════
 # generate_what_changed tests
@@ -248,6 +255,22 @@ class TestGenerateOutlook:
         assert result.endswith(".")
 
 
+class TestGenerateAll:
+    """generate_all must match the individual generators exactly."""
+
+    def test_matches_individual_generators(self, credibility):
+        profile = UserProfile(user_id="u1", topic_weights={"geopolitics": 0.9})
+        c = _make_candidate(
+            urgency=UrgencyLevel.BREAKING,
+            corroborated_by=["bbc", "ap", "guardian"],
+            regions=["middle_east"],
+        )
+        block = generate_all(c, credibility, profile)
+        assert block.why == generate_why(c, credibility, profile)
+        assert block.what_changed == generate_what_changed(c, credibility)
+        assert block.outlook == generate_outlook(c, credibility)
+
+
 # ══════════════════════════════════════════════════════════════════════════
 # generate_adjacent_reads tests
 # ══════════════════════════════════════════════════════════════════════════
@@ -341,6 +364,18 @@ class TestGenerateAdjacentReads:
         # Source should be in brackets
         assert "[bbc]" in reads[0]
 
+    def test_long_titles_truncated_at_word_boundary(self):
+        main = _make_candidate(source="reuters")
+        long_title = "Word " * 40
+        sibling = _make_candidate(source="bbc", title=long_title)
+        thread = NarrativeThread(
+            thread_id="t1", headline="Thread",
+            candidates=[main, sibling],
+        )
+        reads = generate_adjacent_reads(main, [thread], [_make_candidate(source="ap", title="x" * 120)])
+        assert reads[0] == long_title[:99] + "... [bbc]"
+        assert reads[1] == "x" * 97 + "... [ap]"
+
 
 # ══════════════════════════════════════════════════════════════════════════
 # Onboarding tests
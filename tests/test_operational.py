@@ -793,5 +793,37 @@ class TestPollingLoopErrors(unittest.TestCase):
         self.assertIn("Delivered 3 scheduled briefings", log_text)
 
 
+# ══════════════════════════════════════════════════════════════════════════
+# 7. JSON log formatter
+# ══════════════════════════════════════════════════════════════════════════
+
+
+class TestJSONFormatter(unittest.TestCase):
+    """JSON log lines stay valid whichever serializer is installed."""
+
+    def _record(self, created: float, **extra) -> logging.LogRecord:
+        record = logging.LogRecord("newsfeed.test", logging.WARNING, "f.py", 7, "hi %s", ("x",), None)
+        record.created, record.msecs = created, (created % 1) * 1000
+        record.__dict__.update(extra)
+        return record
+
+    def test_timestamp_cache_tracks_each_second(self) -> None:
+        import json
+        from newsfeed.logging_config import JSONFormatter
+        fmt = JSONFormatter()
+        first = json.loads(fmt.format(self._record(1700000000.25, request_id="r1")))
+        second = json.loads(fmt.format(self._record(1700000001.5)))
+        self.assertEqual(first["ts"], "2023-11-14T22:13:20.250Z")
+        self.assertEqual(second["ts"], "2023-11-14T22:13:21.500Z")
+        self.assertEqual((first["msg"], first["request_id"], first["file"]), ("hi x", "r1", "f.py:7"))
+
+    def test_stdlib_fallback_for_values_orjson_rejects(self) -> None:
+        import json
+        from newsfeed import logging_config
+        fmt = logging_config.JSONFormatter()
+        entry = json.loads(fmt.format(self._record(1700000000.0, duration_ms=2 ** 70)))
+        self.assertEqual(entry["duration_ms"], 2 ** 70)
+
+
 if __name__ == "__main__":
     unittest.main()
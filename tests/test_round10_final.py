@@ -146,6 +146,42 @@ class TestExtractArticleText(unittest.TestCase):
         text = extract_article_text(html)
         self.assertIn("A" * 50, text)
 
+    def test_target_chars_stops_early(self):
+        para = "<p>" + "Substantive reporting sentence with detail. " * 3 + "</p>"
+        html = "<article>" + para * 50 + "</article>"
+        full = extract_article_text(html)
+        limited = extract_article_text(html, target_chars=100)
+        self.assertLess(len(limited), len(full))
+        self.assertGreaterEqual(len(limited), 400)
+
+    def test_bytes_input_matches_str_input(self):
+        self.assertEqual(
+            extract_article_text(_SAMPLE_HTML.encode("utf-8")),
+            extract_article_text(_SAMPLE_HTML),
+        )
+        html = "<p>Zürich officials met with délégués to discuss the new rules today.</p>"
+        self.assertIn("Zürich", extract_article_text(html.encode("utf-8")))
+        self.assertIn("Zürich", extract_article_text(html.encode("latin-1")))
+
+    def test_bytes_input_uses_one_encoding_per_page(self):
+        # A latin-1 paragraph ending in a non-ASCII byte keeps its last char
+        first = "<p>Officials met at the caf\u00e9</p>"
+        second = "<p>Later they walked to the station in Z\u00fcrich to talk.</p>"
+        html = (first.replace("<p>", "<p>" + "Reporting detail. " * 3) + second).encode("latin-1")
+        text = extract_article_text(html)
+        self.assertIn("caf\u00e9", text)
+        self.assertIn("Z\u00fcrich", text)
+        # A UTF-8 character cut by the read cap at the end of the page is dropped
+        cut = ("<p>" + "Reporting detail. " * 3 + "Z\u00fcrich</p><p>\u00e9").encode("utf-8")[:-1]
+        self.assertIn("Z\u00fcrich", extract_article_text(cut))
+
+    def test_linear_regex_helper_matches_re_semantics(self):
+        import re
+        from newsfeed.intelligence._linear_re import compile_linear
+        self.assertIsNotNone(compile_linear(r"cookie", re.IGNORECASE).search("COOKIE banner"))
+        # Lookarounds are outside RE2's syntax and must still compile
+        self.assertEqual(compile_linear(r"(?<![A-Z])EU\b").findall("EU and NEU"), ["EU"])
+
     def test_decode_html_entities(self):
         result = _decode_entities("AT&amp;T &mdash; 100&nbsp;points")
         self.assertIn("AT&T", result)
@@ -192,6 +228,14 @@ class TestExtractiveSummary(unittest.TestCase):
         without_quote = _paragraph_score("This is significant said the expert about findings.", 2, 10)
         self.assertGreater(with_quote, without_quote)
 
+    def test_boilerplate_penalty_keeps_density_terms(self):
+        # A fact-dense lead paragraph with a credit line still outranks a
+        # weak late one: the penalty is subtracted from the full score.
+        dense = ('"Rates fall," said Christine Lagarde in Frankfurt on 12 June, '
+                 'citing 2.4% inflation and 1.1% growth. Getty Images')
+        weak = "the talks continued into the evening without any outcome."
+        self.assertGreater(_paragraph_score(dense, 0, 10), _paragraph_score(weak, 9, 10))
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Article Fetching
@@ -221,6 +265,44 @@ class TestFetchArticle(unittest.TestCase):
         result = fetch_article("data:text/html,<h1>Hi</h1>")
         self.assertEqual(result, "")
 
+    def test_throttle_assigns_ordered_slots_per_host(self):
+        from newsfeed.intelligence.enrichment import _throttle_domain
+        with patch("newsfeed.intelligence.enrichment.time.sleep") as mock_sleep:
+            for _ in range(3):
+                _throttle_domain("https://throttle-slots.test/a")
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 2)
+        self.assertAlmostEqual(waits[0], 0.5, places=1)
+        self.assertAlmostEqual(waits[1], 1.0, places=1)
+
+    def _mock_response(self, headers: dict, body: bytes) -> MagicMock:
+        resp = MagicMock()
+        resp.headers = headers
+        resp.read.side_effect = lambda n=-1: body if n < 0 else body[:n]
+        resp.__enter__ = lambda s: s
+        resp.__exit__ = MagicMock(return_value=False)
+        return resp
+
+    @patch("newsfeed.intelligence.enrichment._throttle_domain")
+    @patch("newsfeed.intelligence.enrichment._check_fetch_url_ip", return_value=True)
+    def test_rejects_oversized_content_length(self, _ip, _throttle):
+        resp = self._mock_response(
+            {"Content-Type": "text/html", "Content-Length": str(50 * 1024 * 1024)}, b"<p>x</p>",
+        )
+        with patch("urllib.request.urlopen", return_value=resp):
+            self.assertEqual(fetch_article("https://news.test/big"), "")
+        resp.read.assert_not_called()
+
+    @patch("newsfeed.intelligence.enrichment._throttle_domain")
+    @patch("newsfeed.intelligence.enrichment._check_fetch_url_ip", return_value=True)
+    def test_caps_body_read_size(self, _ip, _throttle):
+        from newsfeed.intelligence.enrichment import _MAX_ARTICLE_BYTES
+        body = b"a" * (_MAX_ARTICLE_BYTES + 1000)
+        resp = self._mock_response({"Content-Type": "text/html"}, body)
+        with patch("urllib.request.urlopen", return_value=resp):
+            result = fetch_article("https://news.test/huge")
+        self.assertEqual(len(result), _MAX_ARTICLE_BYTES)
+
 
 # ══════════════════════════════════════════════════════════════════════
 # ArticleEnricher (batch enrichment)
@@ -267,10 +349,10 @@ class TestArticleEnricher(unittest.TestCase):
         self.assertGreater(len(summary), 50)
         self.assertIn("European Central Bank", summary)
 
-    @patch("newsfeed.intelligence.enrichment.fetch_article")
+    @patch("newsfeed.intelligence.enrichment.fetch_article_bytes")
     def test_enrich_replaces_short_summaries(self, mock_fetch):
         """Articles with longer extracted text should replace RSS teasers."""
-        mock_fetch.return_value = _SAMPLE_HTML
+        mock_fetch.return_value = _SAMPLE_HTML.encode("utf-8")
         enricher = ArticleEnricher(max_workers=1)
         c = _make_candidate(
             url="https://reuters.com/ecb-rate-cut",
@@ -280,10 +362,10 @@ class TestArticleEnricher(unittest.TestCase):
         # Summary should have been replaced with a longer extractive one
         self.assertGreater(len(result[0].summary), len("ECB cuts rates."))
 
-    @patch("newsfeed.intelligence.enrichment.fetch_article")
+    @patch("newsfeed.intelligence.enrichment.fetch_article_bytes")
     def test_enrich_preserves_summary_on_fetch_failure(self, mock_fetch):
         """If fetch returns empty, original summary should be preserved."""
-        mock_fetch.return_value = ""
+        mock_fetch.return_value = b""
         enricher = ArticleEnricher(max_workers=1)
         c = _make_candidate(
             url="https://reuters.com/error-story",
@@ -300,6 +382,81 @@ class TestArticleEnricher(unittest.TestCase):
         # No URL → no fetch → summary unchanged
         self.assertEqual(result[0].summary, "No URL story.")
 
+    @patch("newsfeed.intelligence.enrichment.llm_summary")
+    @patch("newsfeed.intelligence.enrichment.llm_batch_summary")
+    @patch("newsfeed.intelligence.enrichment.fetch_article_bytes")
+    def test_enrich_batches_llm_summaries(self, mock_fetch, mock_batch, mock_single):
+        """With an LLM key, all fetched articles go out in one batched request."""
+        mock_fetch.return_value = _SAMPLE_HTML.encode("utf-8")
+        mock_batch.return_value = {0: "B" * 120, 1: "B" * 120}
+        enricher = ArticleEnricher(llm_api_key="sk-test", max_workers=2)
+        cands = [
+            _make_candidate(cid=f"c{i}", url=f"https://reuters.com/{i}", summary="Teaser.")
+            for i in range(2)
+        ]
+        enricher.enrich(cands)
+        mock_batch.assert_called_once()
+        self.assertEqual(len(mock_batch.call_args[0][0]), 2)
+        mock_single.assert_not_called()
+        self.assertTrue(all(c.summary == "B" * 120 for c in cands))
+
+    @patch("newsfeed.intelligence.enrichment.llm_summary")
+    @patch("newsfeed.intelligence.enrichment.llm_batch_summary")
+    @patch("newsfeed.intelligence.enrichment.fetch_article_bytes")
+    def test_enrich_batch_falls_back_per_article(self, mock_fetch, mock_batch, mock_single):
+        """Articles missing from the batch reply are summarized individually."""
+        mock_fetch.return_value = _SAMPLE_HTML.encode("utf-8")
+        mock_batch.return_value = {0: "B" * 120}
+        mock_single.return_value = "S" * 120
+        enricher = ArticleEnricher(llm_api_key="sk-test", max_workers=2)
+        cands = [
+            _make_candidate(cid=f"c{i}", url=f"https://reuters.com/{i}", summary="Teaser.")
+            for i in range(2)
+        ]
+        enricher.enrich(cands)
+        self.assertEqual(mock_single.call_count, 1)
+        self.assertEqual(sorted(c.summary[0] for c in cands), ["B", "S"])
+
+    @patch("newsfeed.intelligence.enrichment.llm_summary")
+    @patch("newsfeed.intelligence.enrichment.llm_batch_summary")
+    @patch("newsfeed.intelligence.enrichment.fetch_article_bytes")
+    def test_enrich_batch_splits_to_fit_token_cap(self, mock_fetch, mock_batch, mock_single):
+        """Large batches are split so no request truncates its summaries."""
+        from newsfeed.intelligence.enrichment import _BATCH_MAX_ARTICLES
+        mock_fetch.return_value = _SAMPLE_HTML.encode("utf-8")
+        mock_batch.side_effect = lambda arts, *a, **kw: {i: "B" * 120 for i in range(len(arts))}
+        enricher = ArticleEnricher(llm_api_key="sk-test", max_workers=4)
+        cands = [
+            _make_candidate(cid=f"c{i}", url=f"https://reuters.com/{i}", summary="Teaser.")
+            for i in range(_BATCH_MAX_ARTICLES + 3)
+        ]
+        enricher.enrich(cands)
+        sizes = sorted(len(call[0][0]) for call in mock_batch.call_args_list)
+        self.assertEqual(sizes, [3, _BATCH_MAX_ARTICLES])
+        mock_single.assert_not_called()
+        self.assertTrue(all(c.summary == "B" * 120 for c in cands))
+
+    @patch("newsfeed.intelligence.enrichment.llm_summary")
+    @patch("newsfeed.intelligence.enrichment.llm_batch_summary")
+    def test_summarize_batch_respects_stage_deadline(self, mock_batch, mock_single):
+        """Past the stage deadline neither the batch nor the fallbacks run."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        enricher = ArticleEnricher(llm_api_key="sk-test")
+        fetched = [(_make_candidate(cid=f"c{i}"), "text " * 50) for i in range(2)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            summaries = enricher._summarize_batch(fetched, pool, time.monotonic() - 1)
+        self.assertEqual(summaries, ["", ""])
+        mock_batch.assert_not_called()
+        mock_single.assert_not_called()
+
+    def test_parse_batch_response(self):
+        from newsfeed.intelligence.enrichment import _parse_batch_response
+        reply = '```json\n{"0": "' + "x" * 60 + '", "1": "short", "7": "' + "y" * 60 + '"}\n```'
+        parsed = _parse_batch_response(reply, 2)
+        self.assertEqual(list(parsed), [0])
+        self.assertEqual(_parse_batch_response("not json", 2), {})
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Entity Extraction Cap (O(n²) prevention)
@@ -327,12 +484,32 @@ class TestEntityExtractionCap(unittest.TestCase):
         self.assertIn("China", entities["countries"])
         self.assertIn("Taiwan", entities["countries"])
 
+    def test_known_entities_respect_word_boundaries(self):
+        entities = extract_entities("Europe weighs a USB-C mandate as the Federal Reserve meets.")
+        self.assertNotIn("EU", entities["organizations"])
+        self.assertNotIn("Fed", entities["organizations"])
+        self.assertIn("Federal Reserve", entities["organizations"])
+        self.assertNotIn("US", entities["countries"])
+
+    def test_long_acronyms_match_title_case(self):
+        entities = extract_entities("Nato allies and Opec ministers met. Who decides?")
+        self.assertIn("NATO", entities["organizations"])
+        self.assertIn("OPEC", entities["organizations"])
+        self.assertNotIn("WHO", entities["organizations"])
+
     def test_empty_text_returns_empty_sets(self):
         entities = extract_entities("")
         self.assertEqual(len(entities["people"]), 0)
         self.assertEqual(len(entities["organizations"]), 0)
         self.assertEqual(len(entities["countries"]), 0)
 
+    def test_memoized_item_entities_are_read_only(self):
+        from newsfeed.intelligence.entities import _entities_for_text
+        entities = _entities_for_text("NATO and the EU met in Geneva.")
+        with self.assertRaises(TypeError):
+            entities["people"] = frozenset({"Someone"})  # type: ignore[index]
+        self.assertIs(_entities_for_text("NATO and the EU met in Geneva."), entities)
+
     def test_entity_dashboard_caps_connections(self):
         """With many entities, connection building should be capped at 50."""
         # Create items with many unique entities to trigger the cap
@@ -348,6 +525,27 @@ class TestEntityExtractionCap(unittest.TestCase):
         # The connections list should still be bounded
         self.assertLessEqual(len(dashboard["connections"]), 10)
 
+    def test_entity_dashboard_counts_shared_stories(self):
+        """Connections report how many stories each entity pair shares."""
+        c1 = _make_candidate(cid="c1", title="Biden and NATO discuss Ukraine")
+        c2 = _make_candidate(cid="c2", title="Biden meets NATO leaders")
+        c3 = _make_candidate(cid="c3", title="Biden praises NATO unity on Ukraine")
+        items = [MagicMock(candidate=c) for c in (c1, c2, c3)]
+        dashboard = format_entity_dashboard(items)
+        pairs = {frozenset((a, b)): n for a, b, n in dashboard["connections"]}
+        self.assertEqual(pairs[frozenset(("Biden", "NATO"))], 3)
+        self.assertEqual(pairs[frozenset(("NATO", "Ukraine"))], 2)
+
+    def test_map_and_dashboard_share_extraction(self):
+        """A SITREP map followed by the dashboard scans each story only once."""
+        from newsfeed.intelligence import entities as ent
+        items = [MagicMock(candidate=_make_candidate(cid=f"s{i}", title=f"Macron visits Poland {i}"))
+                 for i in range(3)]
+        with patch.object(ent, "extract_entities", wraps=ent.extract_entities) as spy:
+            build_entity_map(items)
+            format_entity_dashboard(items)
+        self.assertEqual(spy.call_count, 3)
+
     def test_entity_map_filters_singletons(self):
         """Entities appearing in only one story should be excluded."""
         c1 = _make_candidate(cid="c1", title="Biden speaks about NATO reform")
@@ -55,6 +55,11 @@ class TestFuzzyTopicCorrection:
         assert corrected == "anything"
         assert hint is None
 
+    def test_known_topics_change_between_calls(self):
+        assert fuzzy_correct_topic("geoplitics", {"technology"})[0] == "geoplitics"
+        assert fuzzy_correct_topic("geoplitics", {"technology", "geopolitics"})[0] == "geopolitics"
+        assert fuzzy_correct_topic("geoplitics", frozenset({"geopolitics"}))[0] == "geopolitics"
+
 
 class TestFuzzyValueMatching:
     """Verify tone/format/cadence fuzzy matching."""